@@ -0,0 +1,63 @@
+"""
+Get market overview concurrently with the async client.
+
+Fetches the summary, gainers, losers, and volume leaders in parallel, so the
+total wait is the slowest request instead of the sum of all four.
+
+Requires aiohttp:
+    pip install "sahmk[async]"
+
+Usage:
+    python async_market_summary.py
+"""
+
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import uvloop  # optional faster event loop: pip install "sahmk[uvloop]"
+except ImportError:
+    uvloop = None
+
+from sahmk import AsyncSahmkClient
+
+API_KEY = os.environ.get("SAHMK_API_KEY", "your_api_key_here")
+
+
+async def main():
+    async with AsyncSahmkClient(API_KEY) as client:
+        summary, gainers, losers, volume = await asyncio.gather(
+            client.market_summary(index="TASI"),
+            client.gainers(limit=5),
+            client.losers(limit=5),
+            client.volume_leaders(limit=5),
+        )
+
+    print("=== Market Summary ===")
+    print(f"TASI: {summary.get('index_value', 'N/A')}")
+    print(f"Change: {summary.get('index_change', 'N/A')} ({summary.get('index_change_percent', 'N/A')}%)")
+    print(f"Mood: {summary.get('market_mood', 'N/A')}")
+    print()
+
+    print("=== Top Gainers ===")
+    for stock in gainers["gainers"]:
+        print(f"  {stock['symbol']} {stock.get('name_en', '')}: +{stock.get('change_percent', 'N/A')}%")
+    print()
+
+    print("=== Top Losers ===")
+    for stock in losers["losers"]:
+        print(f"  {stock['symbol']} {stock.get('name_en', '')}: {stock.get('change_percent', 'N/A')}%")
+    print()
+
+    print("=== Volume Leaders ===")
+    for stock in volume["stocks"]:
+        print(f"  {stock['symbol']} {stock.get('name_en', '')}: {stock.get('volume', 'N/A')}")
+
+
+if __name__ == "__main__":
+    # uvloop.run() needs uvloop>=0.18; older installs fall back to asyncio.
+    run = getattr(uvloop, "run", None) or asyncio.run
+    run(main())
@@ -21,11 +21,14 @@ client = SahmkClient(API_KEY)
 identifiers = ["2222", "الراجحي", "SABIC", "2010", "7010"]
 result = client.quotes(identifiers)
 
-print(f"{'Symbol':<10} {'Name':<25} {'Price':<10} {'Change %':<10}")
-print("-" * 55)
+# Row template parsed once and filled per quote with str.format_map.
+ROW = "{symbol:<10} {name_en:<25} {price:<10} {change_percent:<10}"
 
-for q in result["quotes"]:
-    print(f"{q['symbol']:<10} {q.get('name_en', ''):<25} {q['price']:<10} {q['change_percent']:<10}")
+print(ROW.format(symbol="Symbol", name_en="Name", price="Price", change_percent="Change %"))
+print("-" * 55)
+sys.stdout.write(
+    "".join(ROW.format_map({"name_en": "", **q}) + "\n" for q in result["quotes"])
+)
 
 if result.ambiguous:
     print("\nAmbiguous identifiers:", result.ambiguous)
@@ -7,6 +7,7 @@ Usage:
 
 import sys
 import os
+from collections import deque
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -16,23 +17,29 @@ API_KEY = os.environ.get("SAHMK_API_KEY", "your_api_key_here")
 
 client = SahmkClient(API_KEY)
 
+# Row template parsed once and filled per bar with str.format_map.
+ROW = "{date:<15} {open:<10} {high:<10} {low:<10} {close:<10} {volume:<15}"
+BLANK_ROW = dict.fromkeys(("date", "open", "high", "low", "close", "volume"), "")
+
 # Get Aramco daily data for January 2026 (Starter+ supports 1d/1w/1m)
 result = client.historical("2222", from_date="2026-01-01", to_date="2026-01-28")
 
 records = result["data"]
 print(f"Historical data for {result['symbol']} ({result['count']} records, interval: {result['interval']})")
-print(f"{'Date':<15} {'Open':<10} {'High':<10} {'Low':<10} {'Close':<10} {'Volume':<15}")
+print(ROW.format(date="Date", open="Open", high="High", low="Low", close="Close", volume="Volume"))
 print("-" * 70)
+sys.stdout.write(
+    "\n".join(ROW.format_map({**BLANK_ROW, **record}) for record in records[-10:]) + "\n"
+)
 
-for record in records[-10:]:
-    print(
-        f"{record.get('date', ''):<15} "
-        f"{record.get('open', ''):<10} "
-        f"{record.get('high', ''):<10} "
-        f"{record.get('low', ''):<10} "
-        f"{record.get('close', ''):<10} "
-        f"{record.get('volume', ''):<15}"
-    )
+# Long ranges: stream bars one at a time and keep only the last 10
+# (requires: pip install "sahmk[ijson]")
+tail = deque(
+    client.historical_iter("2222", from_date="2025-01-01", to_date="2026-01-28"),
+    maxlen=10,
+)
+print(f"\nLast {len(tail)} bars of 2025-01-01..2026-01-28 (streamed):")
+sys.stdout.write("\n".join(ROW.format_map({**BLANK_ROW, **bar.raw}) for bar in tail) + "\n")
 
 # Intraday example (plan-limited: 60m available on Pro+, 30m on Business+)
 intraday = client.historical(
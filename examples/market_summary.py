@@ -16,8 +16,26 @@ API_KEY = os.environ.get("SAHMK_API_KEY", "your_api_key_here")
 
 client = SahmkClient(API_KEY)
 
+# Row templates parsed once and filled per stock with str.format_map.
+GAINER_ROW = "  {symbol} {name_en}: +{change_percent}%"
+LOSER_ROW = "  {symbol} {name_en}: {change_percent}%"
+VOLUME_ROW = "  {symbol} {name_en}: {volume}"
+BLANK_ROW = {"name_en": "", "change_percent": "N/A", "volume": "N/A"}
+
+
+def print_rows(template, stocks):
+    sys.stdout.write("".join(template.format_map({**BLANK_ROW, **s}) + "\n" for s in stocks))
+
+
+# The four requests are independent, so fetch them concurrently.
+summary, gainers, losers, volume = client.parallel(
+    lambda: client.market_summary(index="TASI"),
+    lambda: client.gainers(limit=5, index="NOMUC"),
+    lambda: client.losers(limit=5),
+    lambda: client.volume_leaders(limit=5),
+)
+
 # Market overview
-summary = client.market_summary(index="TASI")
 print("=== Market Summary ===")
 print(f"Index: {summary.get('index', 'N/A')}")
 print(f"TASI: {summary.get('index_value', 'N/A')}")
@@ -29,21 +47,15 @@ print()
 
 # Top gainers
 print("=== Top Gainers ===")
-result = client.gainers(limit=5, index="NOMUC")
-for stock in result["gainers"]:
-    print(f"  {stock['symbol']} {stock.get('name_en', '')}: +{stock.get('change_percent', 'N/A')}%")
-print(f"Index: {result.get('index', 'N/A')} | Delayed: {result.get('is_delayed', 'N/A')}")
+print_rows(GAINER_ROW, gainers["gainers"])
+print(f"Index: {gainers.get('index', 'N/A')} | Delayed: {gainers.get('is_delayed', 'N/A')}")
 print()
 
 # Top losers
 print("=== Top Losers ===")
-result = client.losers(limit=5)
-for stock in result["losers"]:
-    print(f"  {stock['symbol']} {stock.get('name_en', '')}: {stock.get('change_percent', 'N/A')}%")
+print_rows(LOSER_ROW, losers["losers"])
 print()
 
 # Volume leaders
 print("=== Volume Leaders ===")
-result = client.volume_leaders(limit=5)
-for stock in result["stocks"]:
-    print(f"  {stock['symbol']} {stock.get('name_en', '')}: {stock.get('volume', 'N/A')}")
+print_rows(VOLUME_ROW, volume["stocks"])
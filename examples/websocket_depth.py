@@ -15,6 +15,11 @@ from contextlib import suppress
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import uvloop  # optional faster event loop: pip install "sahmk[uvloop]"
+except ImportError:
+    uvloop = None
+
 from sahmk import SahmkClient
 from sahmk.client import SahmkError
 
@@ -99,4 +104,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop.run() needs uvloop>=0.18; older installs fall back to asyncio.
+    run = getattr(uvloop, "run", None) or asyncio.run
+    run(main())
@@ -22,6 +22,11 @@ from contextlib import suppress
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import uvloop  # optional faster event loop: pip install "sahmk[uvloop]"
+except ImportError:
+    uvloop = None
+
 from sahmk import SahmkClient
 from sahmk.client import SahmkError
 
@@ -150,4 +155,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    raise SystemExit(asyncio.run(main()))
+    # uvloop.run() needs uvloop>=0.18; older installs fall back to asyncio.
+    run = getattr(uvloop, "run", None) or asyncio.run
+    raise SystemExit(run(main()))
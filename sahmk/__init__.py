@@ -7,6 +7,7 @@ from .client import (
     SahmkAmbiguousIdentifierError,
     SahmkUnknownIdentifierError,
 )
+from .async_client import AsyncSahmkClient
 from .models import (
     Quote,
     BatchQuote,
@@ -48,6 +49,7 @@ from .models import (
 __version__ = "0.15.0"
 __all__ = [
     "SahmkClient",
+    "AsyncSahmkClient",
     "SahmkError",
     "SahmkRateLimitError",
     "SahmkInvalidIndexError",
@@ -0,0 +1,57 @@
+"""Small in-process TTL cache for idempotent GET responses."""
+
+import copy
+import threading
+import time
+
+
+class TTLCache:
+    """
+    Dict-backed cache whose entries expire `ttl` seconds after being stored.
+
+    Values are deep-copied on the way in and out so callers can freely
+    mutate the payloads they receive without corrupting cached entries.
+    When `maxsize` is reached, expired entries are dropped first and then the
+    oldest remaining entry is evicted. Safe to share between threads.
+    """
+
+    def __init__(self, ttl, maxsize=256):
+        self.ttl = float(ttl)
+        self.maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return a copy of the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        """Store a copy of `value` under `key` for `ttl` seconds."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._evict()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self):
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if now >= expires_at]:
+            del self._entries[key]
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
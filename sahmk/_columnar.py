@@ -0,0 +1,84 @@
+"""Columnar (one array per field) conversion of historical OHLCV bars."""
+
+from datetime import datetime, timezone
+
+from .client import SahmkError
+
+_PRICE_FIELDS = ("open", "high", "low", "close")
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise SahmkError(
+            "numpy package required for historical_arrays. "
+            'Install it with: pip install "sahmk[numpy]"'
+        )
+    return numpy
+
+
+def _import_pandas():
+    try:
+        import pandas
+    except ImportError:
+        raise SahmkError(
+            "pandas package required for historical_df. "
+            'Install it with: pip install "sahmk[pandas]"'
+        )
+    return pandas
+
+
+def _to_utc_naive(value):
+    """Parse an ISO-8601 bar timestamp into a naive UTC datetime."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def ohlcv_columns(bars):
+    """
+    Convert OHLCV bars into a dict of NumPy arrays.
+
+    Prices are float32 (missing values become NaN). Volume is int64, or
+    float64 with NaN when any bar lacks it. Dates are datetime64[D] for
+    daily/weekly/monthly bars and datetime64[s] (UTC) for intraday bars.
+
+    Args:
+        bars: Iterable of OHLCV objects
+
+    Returns:
+        Dict with "date", "open", "high", "low", "close", "volume" arrays
+    """
+    np = _import_numpy()
+    bars = list(bars)
+
+    dates = [bar.date for bar in bars]
+    if any(date and "T" in date for date in dates):
+        date_column = np.array(
+            [_to_utc_naive(date) if date else None for date in dates],
+            dtype="datetime64[s]",
+        )
+    else:
+        date_column = np.array(dates, dtype="datetime64[D]")
+
+    columns = {"date": date_column}
+    for name in _PRICE_FIELDS:
+        columns[name] = np.array([getattr(bar, name) for bar in bars], dtype="float32")
+
+    volumes = [bar.volume for bar in bars]
+    volume_dtype = "float64" if None in volumes else "int64"
+    columns["volume"] = np.array(volumes, dtype=volume_dtype)
+    return columns
+
+
+def ohlcv_dataframe(bars):
+    """
+    Build a pandas DataFrame from the ohlcv_columns() arrays.
+
+    Price and volume dtypes are preserved. pandas has no day unit, so the
+    "date" column becomes datetime64[s] on pandas 2+ and datetime64[ns] on 1.x.
+    """
+    pd = _import_pandas()
+    return pd.DataFrame(ohlcv_columns(bars))
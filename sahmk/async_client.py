@@ -0,0 +1,261 @@
+"""
+SAHMK asyncio client
+
+An aiohttp-based counterpart to SahmkClient for issuing REST requests
+concurrently (for example with asyncio.gather).
+https://sahmk.sa/developers/docs
+"""
+
+import asyncio
+
+from .client import SahmkClient, SahmkError, _json_loads
+
+_CONNECTOR_LIMIT = 100
+_CONNECTOR_LIMIT_PER_HOST = 20
+_DNS_CACHE_TTL = 300
+
+
+class _BufferedResponse:
+    """A fully-read aiohttp response exposing the requests-style attributes
+    used by SahmkClient's error builders (status_code, headers, text, json)."""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return _json_loads(self.content)
+
+
+class AsyncSahmkClient(SahmkClient):
+    """
+    Asynchronous SAHMK Developer API client (requires aiohttp).
+
+    Every REST method of SahmkClient is available as a coroutine, so
+    independent endpoints can be fetched concurrently over one pooled
+    connection set. Streaming methods (stream, stream_depth, stream_trades)
+    behave exactly as on SahmkClient.
+
+    Usage:
+        async with AsyncSahmkClient("your_api_key") as client:
+            summary, gainers = await asyncio.gather(
+                client.market_summary(),
+                client.gainers(limit=5),
+            )
+    """
+
+    __slots__ = ("connector_limit", "connector_limit_per_host")
+
+    def __init__(
+        self,
+        api_key,
+        base_url=None,
+        timeout=30,
+        retries=3,
+        backoff_factor=0.5,
+        retry_on_timeout=True,
+        cache_ttl=None,
+        connector_limit=_CONNECTOR_LIMIT,
+        connector_limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+    ):
+        """
+        Initialize the client.
+
+        Accepts the same arguments as SahmkClient, plus:
+
+        Args:
+            connector_limit: Max simultaneous connections in the pool (default: 100)
+            connector_limit_per_host: Max simultaneous connections to the API
+                                      host (default: 20)
+
+        The underlying aiohttp session is created lazily on the first request,
+        inside the running event loop. Call `await client.close()` (or use the
+        client as an async context manager) to release its connections.
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            raise SahmkError(
+                "aiohttp package required for the async client. "
+                "Install it with: pip install aiohttp"
+            )
+
+        self.connector_limit = connector_limit
+        self.connector_limit_per_host = connector_limit_per_host
+        super().__init__(
+            api_key,
+            base_url=base_url,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            retry_on_timeout=retry_on_timeout,
+            cache_ttl=cache_ttl,
+        )
+
+    def _create_session(self):
+        """Defer session creation until a request runs inside an event loop."""
+        return None
+
+    def _get_session(self):
+        """Return the pooled aiohttp session, creating it on first use."""
+        import aiohttp
+
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.connector_limit_per_host,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"X-API-Key": self.api_key},
+            )
+        return self.session
+
+    async def close(self):
+        """Close the underlying aiohttp session and its pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    async def _request(self, method, endpoint, params=None):
+        """Make an API request, serving repeat GETs from the TTL cache when enabled."""
+        cache_key = self._cache_key(method, endpoint, params)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        data = await self._send_request(method, endpoint, params=params)
+        if cache_key is not None:
+            self._cache.set(cache_key, data)
+        return data
+
+    async def _send_request(self, method, endpoint, params=None):
+        """Make an API request with automatic retries for transient failures."""
+        import aiohttp
+
+        url = self._url(endpoint)
+        session = self._get_session()
+        params = self._encode_params(params)
+        last_exc = None
+
+        for attempt in range(1 + self.retries):
+            try:
+                async with session.request(method, url, params=params) as resp:
+                    response = _BufferedResponse(
+                        resp.status, resp.headers, await resp.read()
+                    )
+            except asyncio.TimeoutError as e:
+                last_exc = SahmkError(f"Request timed out: {e}")
+                if self.retry_on_timeout and attempt < self.retries:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+                    continue
+                raise last_exc
+            except aiohttp.ClientError as e:
+                raise SahmkError(f"Request failed: {e}")
+
+            wait = self._retry_wait(response, attempt)
+            if wait is not None:
+                await asyncio.sleep(wait)
+                continue
+            return self._decode_response(response)
+
+        raise last_exc  # pragma: no cover
+
+    async def _get(self, endpoint, params=None, parse=None):
+        """GET an endpoint and optionally parse the JSON payload into a model."""
+        data = await self._request("GET", endpoint, params=params)
+        return parse(data) if parse else data
+
+    def parallel(self, *calls, return_exceptions=False):
+        """
+        Not supported on the async client.
+
+        SahmkClient.parallel runs calls on worker threads; with this client
+        they would only return un-awaited coroutines. Use asyncio.gather()
+        to run coroutines concurrently instead.
+
+        Raises:
+            TypeError: Always
+        """
+        raise TypeError(
+            "AsyncSahmkClient.parallel is not supported; "
+            "run coroutines concurrently with asyncio.gather(...) instead"
+        )
+
+    async def historical_iter(self, symbol, from_date=None, to_date=None, interval=None):
+        """
+        Iterate historical OHLCV bars (async generator).
+
+        The async client buffers the response body, so this is a convenience
+        over historical() for code written with `async for`; use
+        SahmkClient.historical_iter for incremental, low-memory parsing.
+
+        Yields:
+            OHLCV objects, oldest first
+        """
+        result = await self.historical(
+            symbol, from_date=from_date, to_date=to_date, interval=interval
+        )
+        for bar in result.data:
+            yield bar
+
+    async def historical_arrays(self, symbol, from_date=None, to_date=None, interval=None):
+        """Coroutine version of SahmkClient.historical_arrays (requires numpy)."""
+        from ._columnar import ohlcv_columns
+        result = await self.historical(
+            symbol, from_date=from_date, to_date=to_date, interval=interval
+        )
+        return ohlcv_columns(result.data)
+
+    async def historical_df(self, symbol, from_date=None, to_date=None, interval=None):
+        """Coroutine version of SahmkClient.historical_df (requires pandas)."""
+        from ._columnar import ohlcv_dataframe
+        result = await self.historical(
+            symbol, from_date=from_date, to_date=to_date, interval=interval
+        )
+        return ohlcv_dataframe(result.data)
+
+    async def quotes(self, identifiers):
+        """
+        Get batch quotes for multiple stocks (Starter+ plan).
+
+        Args:
+            identifiers: List of symbols/names/aliases (up to 50).
+
+        Returns:
+            BatchQuotesResponse with .quotes list (in the order requested)
+            and .count
+        """
+        joined = self._join_quote_identifiers(identifiers)
+
+        try:
+            data = await self._request(
+                "GET",
+                "/quotes/",
+                params={"identifiers": joined},
+            )
+        except SahmkError as exc:
+            if not self._is_legacy_quotes_param_error(exc):
+                raise
+            data = await self._request(
+                "GET", "/quotes/", params={"symbols": joined}
+            )
+        return self._parse_batch_quotes(data, identifiers)
+
+    async def _fetch_quote_batch(self, symbols):
+        """Fetch one coalesced batch on the client's own session."""
+        return await self.quotes(symbols)
@@ -11,6 +11,17 @@ import sys
 from .client import SahmkClient, SahmkError
 
 
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    # uvloop.run() was added in 0.18; older installs fall back to asyncio.
+    run = getattr(uvloop, "run", None) or asyncio.run
+    return run(coro)
+
+
 def _compact_arg(parser):
     """Add --compact flag to a parser."""
     parser.add_argument(
@@ -274,7 +285,7 @@ def _run_stream(client, symbols):
         )
 
     try:
-        asyncio.run(_stream())
+        _run_async(_stream())
     except KeyboardInterrupt:
         pass
 
@@ -318,7 +329,7 @@ def _run_stream_depth(client, symbols, levels=None):
         )
 
     try:
-        asyncio.run(_stream())
+        _run_async(_stream())
     except KeyboardInterrupt:
         pass
 
@@ -365,7 +376,7 @@ def _run_stream_trades(client, symbols):
         )
 
     try:
-        asyncio.run(_stream())
+        _run_async(_stream())
     except KeyboardInterrupt:
         pass
 
@@ -5,12 +5,27 @@ A lightweight wrapper for the SAHMK Developer API.
 https://sahmk.sa/developers/docs
 """
 
+import email.utils
 import json
 import logging
+import os
 import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from ._cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 BASE_URL = "https://api.sahmk.sa/api/v1"
 WS_URL = "wss://api.sahmk.sa/ws/v1/stocks/"
@@ -29,6 +44,113 @@ _DEPTH_LEVELS_MIN = 1
 _DEPTH_LEVELS_MAX = 20
 _TRADES_LIMIT_MIN = 1
 _TRADES_LIMIT_MAX = 200
+_HTTP2_MAX_KEEPALIVE_CONNECTIONS = 20
+_HTTP2_MAX_CONNECTIONS = 100
+_QUOTE_BATCH_WINDOW = 0.010
+_QUOTE_BATCH_MAX_SIZE = 50
+_PARALLEL_MAX_WORKERS = 8
+_WS_MESSAGE_QUEUE_SIZE = 1024
+_WS_STREAM_CLOSED = object()
+_HTTP_POOL_CONNECTIONS = 10
+_HTTP_POOL_MAXSIZE = 20
+_SESSION_CACHE_MAX_KEYS = 32
+_RATE_LIMIT_MAX_WAIT = 30.0
+_EPOCH_SECONDS_THRESHOLD = 1_000_000_000
+_FIXED_ENDPOINTS = (
+    "/quotes/",
+    "/market/summary/",
+    "/market/gainers/",
+    "/market/losers/",
+    "/market/volume/",
+    "/market/value/",
+    "/market/sectors/",
+    "/companies/",
+    "/analytics/compare/",
+    "/events/",
+)
+
+_session_cache = OrderedDict()
+_session_cache_lock = threading.Lock()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_shared_session(api_key):
+    """
+    Return the process-wide requests.Session for `api_key`, creating it on first use.
+
+    Clients built with the same key share one connection pool, so a new
+    SahmkClient in a notebook or test run reuses sockets (and TLS sessions)
+    that are already open to the API host. At most `_SESSION_CACHE_MAX_KEYS`
+    keys are kept; the least recently used one is dropped from the cache (clients
+    already holding it keep working) so multi-tenant processes stay bounded.
+    """
+    with _session_cache_lock:
+        session = _session_cache.get(api_key)
+        if session is not None:
+            _session_cache.move_to_end(api_key)
+        else:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_HTTP_POOL_CONNECTIONS,
+                pool_maxsize=_HTTP_POOL_MAXSIZE,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"X-API-Key": api_key})
+            _session_cache[api_key] = session
+            while len(_session_cache) > _SESSION_CACHE_MAX_KEYS:
+                _session_cache.popitem(last=False)
+        return session
+
+
+def _get_executor():
+    """Return the process-wide thread pool used by SahmkClient.parallel()."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_PARALLEL_MAX_WORKERS,
+                thread_name_prefix="sahmk",
+            )
+    return _executor
+
+
+def _reset_after_fork():
+    """
+    Drop pools inherited from the parent so a forked child builds its own.
+
+    The parent's thread pool has no live workers in the child, and its pooled
+    sessions hold keep-alive sockets the parent is still using.
+    """
+    global _executor, _executor_lock, _session_cache_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+    _session_cache.clear()
+    _session_cache_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict (no NaN/Infinity); defer to the stdlib parser,
+            # which also produces the error for genuinely invalid payloads.
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize an object to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
 
 
 class SahmkError(Exception):
@@ -156,6 +278,83 @@ class SahmkUnknownIdentifierError(SahmkIdentifierResolutionError):
         )
 
 
+class _QuoteCoalescer:
+    """
+    Merge concurrent single-symbol quote lookups into batch /quotes/ requests.
+
+    Symbols submitted within `window` seconds of the first pending one are
+    fetched together; the batch is flushed early once `max_size` symbols are
+    pending. Bound to the event loop it was created on.
+    """
+
+    def __init__(self, loop, fetch, window=_QUOTE_BATCH_WINDOW, max_size=_QUOTE_BATCH_MAX_SIZE):
+        self.loop = loop
+        self._fetch = fetch
+        self._window = window
+        self._max_size = max_size
+        self._pending = []
+        self._flush_handle = None
+        self._tasks = set()
+
+    def submit(self, symbol):
+        """Queue a symbol and return a future resolving to its BatchQuote."""
+        future = self.loop.create_future()
+        self._pending.append((str(symbol), future))
+        if len(self._pending) >= self._max_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self._window, self.flush)
+        return future
+
+    def flush(self):
+        """Send every pending symbol as one batch request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        task = self.loop.create_task(self._resolve(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, pending):
+        import asyncio
+
+        symbols = list(dict.fromkeys(symbol for symbol, _ in pending))
+        try:
+            result = await self._fetch(symbols)
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        by_identifier = {}
+        for quote in result.quotes:
+            for key in (quote.requested_identifier, quote.symbol):
+                if key is not None:
+                    by_identifier.setdefault(str(key), quote)
+
+        for symbol, future in pending:
+            if future.done():
+                continue
+            quote = by_identifier.get(symbol)
+            if quote is None:
+                future.set_exception(
+                    SahmkUnknownIdentifierError(
+                        f"Unknown identifier '{symbol}': not returned by batch quotes",
+                        identifier=symbol,
+                    )
+                )
+            else:
+                future.set_result(quote)
+
+
 class SahmkClient:
     """
     SAHMK Developer API client.
@@ -166,6 +365,22 @@ class SahmkClient:
         print(quote["price"])
     """
 
+    __slots__ = (
+        "api_key",
+        "_base_url",
+        "_urls",
+        "timeout",
+        "retries",
+        "backoff_factor",
+        "retry_on_timeout",
+        "http2",
+        "retry_count",
+        "session",
+        "_cache",
+        "_quote_coalescer",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         api_key,
@@ -174,6 +389,8 @@ class SahmkClient:
         retries=3,
         backoff_factor=0.5,
         retry_on_timeout=True,
+        http2=False,
+        cache_ttl=None,
     ):
         """
         Initialize the client.
@@ -183,11 +400,20 @@ class SahmkClient:
             base_url: Override the default API base URL
             timeout: Request timeout in seconds (default: 30)
             retries: Max retry attempts for transient failures — 429 and 5xx.
-                     Set to 0 to disable retries. (default: 3)
+                     429 retries wait for the server's Retry-After (or
+                     X-RateLimit-Reset) hint, capped at 30s. Set to 0 to
+                     disable retries. (default: 3)
             backoff_factor: Multiplier for exponential backoff between retries.
                             Delay = backoff_factor * (2 ** attempt), so with the
                             default 0.5 the delays are 0.5s, 1s, 2s. (default: 0.5)
             retry_on_timeout: Whether to retry on request timeouts. (default: True)
+            http2: Send REST requests over HTTP/2 using httpx, multiplexing
+                   them on a single TLS connection. Requires
+                   `pip install "sahmk[http2]"`. (default: False)
+            cache_ttl: Seconds to cache GET responses in-process, keyed by
+                       endpoint and params. Repeat calls within the TTL are
+                       served from memory. None or 0 disables caching.
+                       (default: None)
         """
         self.api_key = api_key
         self.base_url = (base_url or BASE_URL).rstrip("/")
@@ -195,73 +421,226 @@ class SahmkClient:
         self.retries = retries
         self.backoff_factor = backoff_factor
         self.retry_on_timeout = retry_on_timeout
-        self.session = requests.Session()
-        self.session.headers.update({"X-API-Key": api_key})
+        self.http2 = http2
+        self.retry_count = 0
+        self.session = self._create_session()
+        self._cache = TTLCache(cache_ttl) if cache_ttl else None
+        self._quote_coalescer = None
+
+    @property
+    def base_url(self):
+        """API base URL; assigning it also refreshes the precomputed endpoint URLs."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value):
+        self._base_url = value
+        self._urls = {endpoint: value + endpoint for endpoint in _FIXED_ENDPOINTS}
+
+    def _create_session(self):
+        """Create the HTTP session used for REST requests."""
+        if self.http2:
+            return self._create_http2_session()
+        return _get_shared_session(self.api_key)
+
+    def _create_http2_session(self):
+        """Create an httpx client that multiplexes requests over HTTP/2."""
+        try:
+            import httpx
+
+            return httpx.Client(
+                http2=True,
+                headers={"X-API-Key": self.api_key},
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=_HTTP2_MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=_HTTP2_MAX_CONNECTIONS,
+                ),
+            )
+        except ImportError:
+            raise SahmkError(
+                "httpx and h2 packages required for HTTP/2. "
+                'Install them with: pip install "httpx[http2]"'
+            )
+
+    def _transport_errors(self):
+        """Return the (timeout, request-failure) exception types of the session."""
+        if self.http2:
+            import httpx
+
+            return httpx.TimeoutException, httpx.RequestError
+        return requests.Timeout, requests.RequestException
 
     def _request(self, method, endpoint, params=None):
-        """Make an API request with automatic retries for transient failures."""
-        url = f"{self.base_url}{endpoint}"
+        """Make an API request, serving repeat GETs from the TTL cache when enabled."""
+        cache_key = self._cache_key(method, endpoint, params)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        data = self._send_request(method, endpoint, params=params)
+        if cache_key is not None:
+            self._cache.set(cache_key, data)
+        return data
+
+    def parallel(self, *calls, return_exceptions=False):
+        """
+        Run independent blocking calls concurrently on a shared thread pool.
+
+        Network I/O releases the GIL, so fanning out several endpoints costs
+        roughly the slowest request instead of the sum of all of them.
+
+        Args:
+            *calls: Zero-argument callables, e.g. `client.market_summary` or
+                    `lambda: client.gainers(limit=5)`.
+            return_exceptions: If True, exceptions raised by a call are
+                               returned in its slot instead of re-raised.
+                               (default: False)
+
+        Returns:
+            List of results in the same order as `calls`.
+
+        Usage:
+            summary, gainers = client.parallel(
+                client.market_summary,
+                lambda: client.gainers(limit=5),
+            )
+        """
+        executor = _get_executor()
+        futures = [executor.submit(call) for call in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                results.append(exc)
+        return results
+
+    def _cache_key(self, method, endpoint, params):
+        """Return the TTL-cache key for a request, or None when it is not cacheable."""
+        if self._cache is None or method != "GET":
+            return None
+        return endpoint, tuple(sorted((params or {}).items()))
+
+    def clear_cache(self):
+        """Drop all cached GET responses (no-op when caching is disabled)."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _send_request(self, method, endpoint, params=None, stream=False):
+        """
+        Make an API request with automatic retries for transient failures.
+
+        Returns the decoded JSON payload, or the successful response itself
+        with its body left unread when `stream` is True (requests session only).
+        """
+        url = self._url(endpoint)
+        timeout_error, request_error = self._transport_errors()
+        if self.http2:
+            params = self._encode_params(params)
+        request_kwargs = {"stream": True} if stream else {}
         last_exc = None
 
         for attempt in range(1 + self.retries):
             try:
                 response = self.session.request(
-                    method, url, params=params, timeout=self.timeout
+                    method, url, params=params, timeout=self.timeout, **request_kwargs
                 )
-            except requests.Timeout as e:
+            except timeout_error as e:
                 last_exc = SahmkError(f"Request timed out: {e}")
                 if self.retry_on_timeout and attempt < self.retries:
                     self._backoff(attempt)
                     continue
                 raise last_exc
-            except requests.RequestException as e:
+            except request_error as e:
                 raise SahmkError(f"Request failed: {e}")
 
-            if response.status_code == 429:
-                last_exc = self._build_rate_limit_error(response)
-                if attempt < self.retries:
-                    wait = self._rate_limit_wait(response, attempt)
-                    logger.info(
-                        "Rate limited (429), retrying in %.1fs (attempt %d/%d)...",
-                        wait,
-                        attempt + 1,
-                        self.retries,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise last_exc
+            wait = self._retry_wait(response, attempt)
+            if wait is not None:
+                response.close()
+                time.sleep(wait)
+                continue
+            if stream:
+                return response
+            return self._decode_response(response)
 
-            if response.status_code in _RETRIABLE_STATUS_CODES:
-                last_exc = self._build_api_error(response)
-                if attempt < self.retries:
-                    wait = self.backoff_factor * (2 ** attempt)
-                    logger.info(
-                        "Server error (%d), retrying in %.1fs (attempt %d/%d)...",
-                        response.status_code,
-                        wait,
-                        attempt + 1,
-                        self.retries,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise last_exc
+        raise last_exc  # pragma: no cover
 
-            if response.status_code != 200:
-                raise self._build_api_error(response)
+    def _get(self, endpoint, params=None, parse=None):
+        """GET an endpoint and optionally parse the JSON payload into a model."""
+        data = self._request("GET", endpoint, params=params)
+        return parse(data) if parse else data
 
-            try:
-                return response.json()
-            except (ValueError, TypeError) as e:
-                raise SahmkError(
-                    f"Unexpected non-JSON response: {e}",
-                    status_code=response.status_code,
-                    response=response,
+    def _url(self, endpoint):
+        """Return the absolute URL for an endpoint (precomputed for fixed paths)."""
+        return self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
+
+    @staticmethod
+    def _encode_params(params):
+        """Match requests' query encoding: drop None values, stringify booleans."""
+        if not params:
+            return None
+        return {
+            key: str(value) if isinstance(value, bool) else value
+            for key, value in params.items()
+            if value is not None
+        }
+
+    def _retry_wait(self, response, attempt):
+        """
+        Classify a response for the retry loop.
+
+        Returns the number of seconds to wait before retrying, or None when
+        the response is a successful 200. Raises the matching SahmkError when
+        the response is an error that should not (or can no longer) be retried.
+        """
+        if response.status_code == 429:
+            if attempt < self.retries:
+                wait = self._rate_limit_wait(response, attempt)
+                logger.info(
+                    "Rate limited (429), retrying in %.1fs (attempt %d/%d)...",
+                    wait,
+                    attempt + 1,
+                    self.retries,
                 )
+                self.retry_count += 1
+                return wait
+            raise self._build_rate_limit_error(response)
 
-        raise last_exc  # pragma: no cover
+        if response.status_code in _RETRIABLE_STATUS_CODES:
+            if attempt < self.retries:
+                wait = self.backoff_factor * (2 ** attempt)
+                logger.info(
+                    "Server error (%d), retrying in %.1fs (attempt %d/%d)...",
+                    response.status_code,
+                    wait,
+                    attempt + 1,
+                    self.retries,
+                )
+                self.retry_count += 1
+                return wait
+            raise self._build_api_error(response)
 
-    def _backoff(self, attempt):
-        """Sleep for exponential backoff duration."""
+        if response.status_code != 200:
+            raise self._build_api_error(response)
+        return None
+
+    @staticmethod
+    def _decode_response(response):
+        """Decode a successful response body as JSON."""
+        try:
+            return _json_loads(response.content)
+        except (ValueError, TypeError) as e:
+            raise SahmkError(
+                f"Unexpected non-JSON response: {e}",
+                status_code=response.status_code,
+                response=response,
+            )
+
+    def _backoff_delay(self, attempt):
+        """Return (and log) the exponential backoff duration for an attempt."""
         wait = self.backoff_factor * (2 ** attempt)
         logger.info(
             "Request failed, retrying in %.1fs (attempt %d/%d)...",
@@ -269,19 +648,20 @@ class SahmkClient:
             attempt + 1,
             self.retries,
         )
-        time.sleep(wait)
+        self.retry_count += 1
+        return wait
+
+    def _backoff(self, attempt):
+        """Sleep for exponential backoff duration."""
+        time.sleep(self._backoff_delay(attempt))
 
     @staticmethod
     def _build_rate_limit_error(response):
         """Build a SahmkRateLimitError from a 429 response."""
         headers = response.headers
-        retry_after = None
-        raw = headers.get("Retry-After")
-        if raw:
-            try:
-                retry_after = float(raw)
-            except (ValueError, TypeError):
-                pass
+        retry_after = SahmkClient._parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            retry_after = max(retry_after, 0.0)
 
         def _header_int(name):
             val = headers.get(name)
@@ -353,14 +733,57 @@ class SahmkClient:
         )
 
     def _rate_limit_wait(self, response, attempt):
-        """Determine wait time for a 429 response, preferring Retry-After header."""
-        raw = response.headers.get("Retry-After")
-        if raw:
+        """
+        Determine wait time for a 429 response.
+
+        Prefers the Retry-After header (seconds or HTTP date), then
+        X-RateLimit-Reset (epoch seconds, seconds until reset, or an ISO-8601
+        timestamp), then exponential backoff. Server hints are capped at
+        _RATE_LIMIT_MAX_WAIT seconds.
+        """
+        headers = response.headers
+        wait = self._parse_retry_after(headers.get("Retry-After"))
+        if wait is None:
+            wait = self._parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+        if wait is None:
+            return self.backoff_factor * (2 ** attempt)
+        return min(max(wait, 0.0), _RATE_LIMIT_MAX_WAIT)
+
+    @staticmethod
+    def _parse_retry_after(raw):
+        """Parse a Retry-After header into seconds, or None if absent/invalid."""
+        if not raw:
+            return None
+        try:
+            return float(raw)
+        except (ValueError, TypeError):
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(raw)
+        except (ValueError, TypeError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return retry_at.timestamp() - time.time()
+
+    @staticmethod
+    def _parse_rate_limit_reset(raw):
+        """Parse an X-RateLimit-Reset header into seconds until reset, or None."""
+        if not raw:
+            return None
+        try:
+            value = float(raw)
+        except (ValueError, TypeError):
             try:
-                return float(raw)
-            except (ValueError, TypeError):
-                pass
-        return self.backoff_factor * (2 ** attempt)
+                reset_at = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=timezone.utc)
+            return reset_at.timestamp() - time.time()
+        if value >= _EPOCH_SECONDS_THRESHOLD:
+            return value - time.time()
+        return value
 
     @staticmethod
     def _normalize_market_index(index):
@@ -377,13 +800,9 @@ class SahmkClient:
 
     def _market_params(self, limit=None, index=None):
         """Build validated query params for market endpoints."""
-        params = {}
-        if limit is not None:
-            params["limit"] = limit
-        normalized_index = self._normalize_market_index(index)
-        if normalized_index is not None:
-            params["index"] = normalized_index
-        return params or None
+        return self._clean_params(
+            {"limit": limit, "index": self._normalize_market_index(index)}
+        )
 
     @staticmethod
     def _validate_limit_offset(limit, offset):
@@ -401,13 +820,14 @@ class SahmkClient:
     def _companies_params(self, search=None, market=None, limit=100, offset=0):
         """Build validated query params for the company directory endpoint."""
         self._validate_limit_offset(limit=limit, offset=offset)
-        params = {"limit": limit, "offset": offset}
-        if search is not None:
-            params["search"] = search
-        normalized_market = self._normalize_market_index(market)
-        if normalized_market is not None:
-            params["market"] = normalized_market
-        return params
+        return self._clean_params(
+            {
+                "limit": limit,
+                "offset": offset,
+                "search": search,
+                "market": self._normalize_market_index(market),
+            }
+        )
 
     # -------------------------------------------------------------------------
     # Quotes
@@ -425,8 +845,7 @@ class SahmkClient:
             Quote object (supports dict-style access via [] for backwards compat)
         """
         from .models import Quote
-        data = self._request("GET", f"/quote/{identifier}/")
-        return Quote.from_dict(data)
+        return self._get(f"/quote/{identifier}/", parse=Quote.from_dict)
 
     @staticmethod
     def _is_legacy_quotes_param_error(exc):
@@ -442,6 +861,54 @@ class SahmkClient:
             return True
         return "symbols" in str(exc).lower()
 
+    @staticmethod
+    def _join_quote_identifiers(identifiers):
+        """
+        Validate batch-quote identifiers and join them for the query string.
+
+        Identifiers are deduplicated and sorted, so equivalent batches produce
+        the same URL (and hit the same TTL/HTTP cache entry) regardless of the
+        order the caller listed them in.
+        """
+        if isinstance(identifiers, str):
+            identifiers = [identifiers]
+        if not identifiers:
+            raise ValueError("At least one symbol is required")
+        unique = sorted({str(identifier) for identifier in identifiers})
+        if len(unique) > 50:
+            raise SahmkError("Maximum 50 symbols per batch request")
+        return ",".join(unique)
+
+    @staticmethod
+    def _parse_batch_quotes(data, identifiers):
+        """
+        Build a BatchQuotesResponse with quotes back in the caller's order.
+
+        Quotes are matched to identifiers by requested_identifier or symbol.
+        Quotes that match no identifier (e.g. resolved from a name the
+        backend echoes differently) keep their response order at the end.
+        """
+        from .models import BatchQuotesResponse
+        if isinstance(identifiers, str):
+            identifiers = [identifiers]
+        quotes = data.get("quotes")
+        if isinstance(quotes, list):
+            by_identifier = {}
+            for quote in quotes:
+                for key in (quote.get("requested_identifier"), quote.get("symbol")):
+                    if key is not None:
+                        by_identifier.setdefault(str(key), quote)
+            ordered = []
+            placed = set()
+            for identifier in identifiers:
+                quote = by_identifier.get(str(identifier))
+                if quote is not None and id(quote) not in placed:
+                    placed.add(id(quote))
+                    ordered.append(quote)
+            ordered.extend(quote for quote in quotes if id(quote) not in placed)
+            data = {**data, "quotes": ordered}
+        return BatchQuotesResponse.from_dict(data)
+
     def quotes(self, identifiers):
         """
         Get batch quotes for multiple stocks (Starter+ plan).
@@ -451,16 +918,10 @@ class SahmkClient:
                          symbol-only usage remains fully supported.
 
         Returns:
-            BatchQuotesResponse with .quotes list and .count
+            BatchQuotesResponse with .quotes list (in the order requested)
+            and .count
         """
-        from .models import BatchQuotesResponse
-        if isinstance(identifiers, str):
-            identifiers = [identifiers]
-        if not identifiers:
-            raise ValueError("At least one symbol is required")
-        if len(identifiers) > 50:
-            raise SahmkError("Maximum 50 symbols per batch request")
-        joined = ",".join(str(identifier) for identifier in identifiers)
+        joined = self._join_quote_identifiers(identifiers)
 
         # Prefer the new backend contract first. If the backend is older and
         # rejects `identifiers`, transparently fall back to `symbols`.
@@ -474,7 +935,44 @@ class SahmkClient:
             if not self._is_legacy_quotes_param_error(exc):
                 raise
             data = self._request("GET", "/quotes/", params={"symbols": joined})
-        return BatchQuotesResponse.from_dict(data)
+        return self._parse_batch_quotes(data, identifiers)
+
+    async def quote_batched(self, symbol):
+        """
+        Get a quote, coalescing concurrent calls into one batch request (Starter+ plan).
+
+        Calls awaited together (for example via asyncio.gather) within a
+        10 ms window are merged into a single /quotes/ request of up to 50
+        symbols, so N concurrent lookups cost one round-trip.
+
+        Args:
+            symbol: Stock symbol (e.g., "2222")
+
+        Returns:
+            BatchQuote object for the symbol
+
+        Raises:
+            SahmkUnknownIdentifierError: if the batch response has no quote
+                                         for the symbol.
+
+        Usage:
+            quotes = await asyncio.gather(
+                *(client.quote_batched(s) for s in ["2222", "1120", "7010"])
+            )
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._quote_coalescer is None or self._quote_coalescer.loop is not loop:
+            self._quote_coalescer = _QuoteCoalescer(loop, self._fetch_quote_batch)
+        return await self._quote_coalescer.submit(symbol)
+
+    async def _fetch_quote_batch(self, symbols):
+        """Fetch one coalesced batch without blocking the event loop."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.quotes, symbols)
 
     # -------------------------------------------------------------------------
     # Historical
@@ -494,15 +992,110 @@ class SahmkClient:
             HistoricalResponse with .data list of OHLCV objects
         """
         from .models import HistoricalResponse
-        params = {}
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
-        if interval:
-            params["interval"] = interval
-        data = self._request("GET", f"/historical/{symbol}/", params=params)
-        return HistoricalResponse.from_dict(data)
+        return self._get(
+            f"/historical/{symbol}/",
+            params=self._historical_params(from_date, to_date, interval),
+            parse=HistoricalResponse.from_dict,
+        )
+
+    def historical_iter(self, symbol, from_date=None, to_date=None, interval=None):
+        """
+        Iterate historical OHLCV bars as they are parsed (requires ijson).
+
+        Unlike historical(), the response body is streamed and decoded
+        incrementally, so only one bar is held in memory at a time. Useful
+        for long ranges or intraday intervals. Responses are not cached.
+
+        Args:
+            symbol: Stock symbol
+            from_date: Start date YYYY-MM-DD (default: 30 days ago)
+            to_date: End date YYYY-MM-DD (default: today)
+            interval: "1d", "1w", "1m", "30m", or "60m" (default: "1d")
+
+        Yields:
+            OHLCV objects, oldest first
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise SahmkError(
+                "ijson package required for historical_iter. "
+                'Install it with: pip install "sahmk[ijson]"'
+            )
+        from .models import OHLCV
+
+        endpoint = f"/historical/{symbol}/"
+        params = self._historical_params(from_date, to_date, interval)
+        if self.http2:
+            # httpx bodies are not exposed as a file object; parse the buffered payload.
+            data = self._send_request("GET", endpoint, params=params)
+            for item in data.get("data") or []:
+                yield OHLCV.from_dict(item)
+            return
+
+        response = self._send_request("GET", endpoint, params=params, stream=True)
+        try:
+            response.raw.decode_content = True
+            for item in ijson.items(response.raw, "data.item", use_float=True):
+                yield OHLCV.from_dict(item)
+        except ijson.JSONError as e:
+            raise SahmkError(
+                f"Unexpected non-JSON response: {e}",
+                status_code=response.status_code,
+                response=response,
+            )
+        finally:
+            response.close()
+
+    def historical_arrays(self, symbol, from_date=None, to_date=None, interval=None):
+        """
+        Get historical OHLCV data as columnar NumPy arrays (requires numpy).
+
+        One array per field instead of one object per bar, ready for
+        vectorized math (for example `arrays["close"].mean()`).
+
+        Args:
+            symbol: Stock symbol
+            from_date: Start date YYYY-MM-DD (default: 30 days ago)
+            to_date: End date YYYY-MM-DD (default: today)
+            interval: "1d", "1w", "1m", "30m", or "60m" (default: "1d")
+
+        Returns:
+            Dict of arrays: "date" (datetime64[D], or datetime64[s] UTC for
+            intraday), "open"/"high"/"low"/"close" (float32), "volume" (int64)
+        """
+        from ._columnar import ohlcv_columns
+        result = self.historical(
+            symbol, from_date=from_date, to_date=to_date, interval=interval
+        )
+        return ohlcv_columns(result.data)
+
+    def historical_df(self, symbol, from_date=None, to_date=None, interval=None):
+        """
+        Get historical OHLCV data as a pandas DataFrame (requires pandas).
+
+        Args:
+            symbol: Stock symbol
+            from_date: Start date YYYY-MM-DD (default: 30 days ago)
+            to_date: End date YYYY-MM-DD (default: today)
+            interval: "1d", "1w", "1m", "30m", or "60m" (default: "1d")
+
+        Returns:
+            DataFrame with date, open, high, low, close, volume columns.
+            Prices and volume keep the historical_arrays dtypes; "date" is a
+            pandas datetime column (datetime64[s] on pandas 2+, [ns] on 1.x)
+        """
+        from ._columnar import ohlcv_dataframe
+        result = self.historical(
+            symbol, from_date=from_date, to_date=to_date, interval=interval
+        )
+        return ohlcv_dataframe(result.data)
+
+    def _historical_params(self, from_date, to_date, interval):
+        """Build query params for the /historical/ endpoint."""
+        return self._clean_params(
+            {"from": from_date or None, "to": to_date or None, "interval": interval or None}
+        )
 
     # -------------------------------------------------------------------------
     # Market
@@ -520,12 +1113,11 @@ class SahmkClient:
             MarketSummary object
         """
         from .models import MarketSummary
-        data = self._request(
-            "GET",
+        return self._get(
             "/market/summary/",
             params=self._market_params(index=index),
+            parse=MarketSummary.from_dict,
         )
-        return MarketSummary.from_dict(data)
 
     def gainers(self, limit=None, index=None):
         """
@@ -540,12 +1132,11 @@ class SahmkClient:
             MarketMoversResponse with .stocks list
         """
         from .models import MarketMoversResponse
-        data = self._request(
-            "GET",
+        return self._get(
             "/market/gainers/",
             params=self._market_params(limit=limit, index=index),
+            parse=partial(MarketMoversResponse.from_dict, list_key="gainers"),
         )
-        return MarketMoversResponse.from_dict(data, list_key="gainers")
 
     def losers(self, limit=None, index=None):
         """
@@ -560,12 +1151,11 @@ class SahmkClient:
             MarketMoversResponse with .stocks list
         """
         from .models import MarketMoversResponse
-        data = self._request(
-            "GET",
+        return self._get(
             "/market/losers/",
             params=self._market_params(limit=limit, index=index),
+            parse=partial(MarketMoversResponse.from_dict, list_key="losers"),
         )
-        return MarketMoversResponse.from_dict(data, list_key="losers")
 
     def volume_leaders(self, limit=None, index=None):
         """
@@ -580,12 +1170,11 @@ class SahmkClient:
             MarketMoversResponse with .stocks list
         """
         from .models import MarketMoversResponse
-        data = self._request(
-            "GET",
+        return self._get(
             "/market/volume/",
             params=self._market_params(limit=limit, index=index),
+            parse=partial(MarketMoversResponse.from_dict, list_key="stocks"),
         )
-        return MarketMoversResponse.from_dict(data, list_key="stocks")
 
     def value_leaders(self, limit=None, index=None):
         """
@@ -600,12 +1189,11 @@ class SahmkClient:
             MarketMoversResponse with .stocks list
         """
         from .models import MarketMoversResponse
-        data = self._request(
-            "GET",
+        return self._get(
             "/market/value/",
             params=self._market_params(limit=limit, index=index),
+            parse=partial(MarketMoversResponse.from_dict, list_key="stocks"),
         )
-        return MarketMoversResponse.from_dict(data, list_key="stocks")
 
     def sectors(self, index=None):
         """
@@ -619,12 +1207,11 @@ class SahmkClient:
             SectorsResponse with .sectors list
         """
         from .models import SectorsResponse
-        data = self._request(
-            "GET",
+        return self._get(
             "/market/sectors/",
             params=self._market_params(index=index),
+            parse=SectorsResponse.from_dict,
         )
-        return SectorsResponse.from_dict(data)
 
     def depth(self, symbol, levels=None):
         """
@@ -639,16 +1226,11 @@ class SahmkClient:
             MarketDepth object with bids/asks ladders and book metrics
         """
         from .models import MarketDepth
-        params = {}
-        normalized_levels = self._normalize_depth_levels(levels)
-        if normalized_levels is not None:
-            params["levels"] = normalized_levels
-        data = self._request(
-            "GET",
+        return self._get(
             f"/market/depth/{symbol}/",
-            params=params or None,
+            params=self._clean_params({"levels": self._normalize_depth_levels(levels)}),
+            parse=MarketDepth.from_dict,
         )
-        return MarketDepth.from_dict(data)
 
     def trades(self, symbol, limit=None):
         """
@@ -663,16 +1245,11 @@ class SahmkClient:
             TradesResponse with .events list and .summary
         """
         from .models import TradesResponse
-        params = {}
-        normalized_limit = self._normalize_trades_limit(limit)
-        if normalized_limit is not None:
-            params["limit"] = normalized_limit
-        data = self._request(
-            "GET",
+        return self._get(
             f"/market/trades/{symbol}/",
-            params=params or None,
+            params=self._clean_params({"limit": self._normalize_trades_limit(limit)}),
+            parse=TradesResponse.from_dict,
         )
-        return TradesResponse.from_dict(data)
 
     # -------------------------------------------------------------------------
     # Company Data
@@ -692,8 +1269,7 @@ class SahmkClient:
         Returns:
             Raw API response with keys such as results/count/total/limit/offset.
         """
-        return self._request(
-            "GET",
+        return self._get(
             "/companies/",
             params=self._companies_params(
                 search=search,
@@ -712,8 +1288,7 @@ class SahmkClient:
             Company object
         """
         from .models import Company as CompanyModel
-        data = self._request("GET", f"/company/{symbol}/")
-        return CompanyModel.from_dict(data)
+        return self._get(f"/company/{symbol}/", parse=CompanyModel.from_dict)
 
     @staticmethod
     def _clean_params(params):
@@ -771,12 +1346,11 @@ class SahmkClient:
         }
         if period is None:
             params["statement_period"] = statement_period
-        data = self._request(
-            "GET",
+        return self._get(
             f"/financials/{symbol}/",
             params=self._clean_params(params),
+            parse=FinancialsResponse.from_dict,
         )
-        return FinancialsResponse.from_dict(data)
 
     def ratios(self, symbol, history="latest", period="annual", metrics="core"):
         """
@@ -785,8 +1359,7 @@ class SahmkClient:
         Returns:
             Raw API response dict
         """
-        return self._request(
-            "GET",
+        return self._get(
             f"/analytics/ratios/{symbol}/",
             params=self._clean_params(
                 {
@@ -809,8 +1382,7 @@ class SahmkClient:
             Raw API response dict
         """
         joined_symbols = ",".join(self._normalize_symbols(symbols))
-        return self._request(
-            "GET",
+        return self._get(
             "/analytics/compare/",
             params=self._clean_params(
                 {
@@ -828,8 +1400,7 @@ class SahmkClient:
             DividendsResponse object
         """
         from .models import DividendsResponse
-        data = self._request("GET", f"/dividends/{symbol}/")
-        return DividendsResponse.from_dict(data)
+        return self._get(f"/dividends/{symbol}/", parse=DividendsResponse.from_dict)
 
     # -------------------------------------------------------------------------
     # Events
@@ -847,13 +1418,11 @@ class SahmkClient:
             EventsResponse with .events list
         """
         from .models import EventsResponse
-        params = {}
-        if symbol:
-            params["symbol"] = symbol
-        if limit is not None:
-            params["limit"] = limit
-        data = self._request("GET", "/events/", params=params or None)
-        return EventsResponse.from_dict(data)
+        return self._get(
+            "/events/",
+            params=self._clean_params({"symbol": symbol or None, "limit": limit}),
+            parse=EventsResponse.from_dict,
+        )
 
     # -------------------------------------------------------------------------
     # WebSocket Streaming (Pro+ plan)
@@ -870,6 +1439,7 @@ class SahmkClient:
         max_reconnect_attempts=0,
         initial_reconnect_delay=1.0,
         max_reconnect_delay=60.0,
+        wire_format="json",
     ):
         """
         Stream real-time quotes via WebSocket (Pro+ plan).
@@ -892,14 +1462,24 @@ class SahmkClient:
             on_reconnect: Async callback — on_reconnect(attempt) called before
                           a reconnect attempt (after the backoff delay).
                           Receives the attempt number.
-            ping_interval: Seconds between keep-alive pings (default: 30)
-            max_reconnect_attempts: Maximum reconnection attempts. 0 means
+            ping_interval: Seconds between WebSocket protocol pings. The
+                           connection is treated as dead when no pong
+                           arrives within twice this interval. None
+                           disables keep-alive pings. (default: 30)
+            max_reconnect_attempts: Maximum consecutive reconnection attempts.
+                                    The count (and backoff delay) resets once a
+                                    reconnected stream delivers data. 0 means
                                     unlimited reconnection (default). Set to -1
                                     to disable reconnection entirely.
             initial_reconnect_delay: Initial delay in seconds before first
                                      reconnect attempt (default: 1.0)
             max_reconnect_delay: Maximum delay in seconds between reconnect
                                  attempts (default: 60.0)
+            wire_format: "json" (default) or "msgpack". With "msgpack" the
+                         client asks the server for binary MessagePack frames
+                         (requires the msgpack package); text frames are still
+                         decoded as JSON, so servers without msgpack support
+                         keep working unchanged.
 
         Notes:
             - Close code 4401 indicates authentication failure and is not retried.
@@ -924,9 +1504,19 @@ class SahmkClient:
 
         import asyncio
 
+        # Snapshot symbols so reconnects resubscribe to what was requested at
+        # call time even if the caller mutates their list afterwards.
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        decode = self._ws_frame_decoder(wire_format)
         reconnect_enabled = max_reconnect_attempts != -1
         attempt = 0
         delay = initial_reconnect_delay
+        subscribe_frames = {}
+
+        def _reset_backoff():
+            nonlocal attempt, delay
+            attempt = 0
+            delay = initial_reconnect_delay
 
         while True:
             try:
@@ -935,6 +1525,10 @@ class SahmkClient:
                     on_quote=on_quote,
                     on_error=on_error,
                     ping_interval=ping_interval,
+                    on_healthy=_reset_backoff,
+                    subscribe_frames=subscribe_frames,
+                    wire_format=wire_format,
+                    decode=decode,
                 )
                 return
             except SahmkError:
@@ -987,16 +1581,21 @@ class SahmkClient:
         on_quote=None,
         on_error=None,
         ping_interval=30,
+        on_healthy=None,
+        wire_format="json",
+        decode=_json_loads,
+        subscribe_frames=None,
     ):
         """Single WebSocket connection lifecycle: connect, subscribe, listen."""
-        import asyncio
         import websockets
 
         url = f"{WS_URL}?api_key={self.api_key}"
+        if wire_format != "json":
+            url = f"{url}&format={wire_format}"
 
         try:
-            async with websockets.connect(url) as ws:
-                msg = json.loads(await ws.recv())
+            async with websockets.connect(url, **self._ws_keepalive_options(ping_interval)) as ws:
+                msg = decode(await ws.recv())
                 if msg.get("type") == "error":
                     raise SahmkError(
                         f"WebSocket error: {msg.get('message')}",
@@ -1019,47 +1618,38 @@ class SahmkClient:
                     limits.get("max_symbols_per_call") or _DEFAULT_WS_MAX_SYMBOLS_PER_CALL
                 )
 
-                for i in range(0, len(symbols), max_symbols_per_call):
-                    batch = symbols[i : i + max_symbols_per_call]
-                    await ws.send(
-                        json.dumps({"action": "subscribe", "symbols": batch})
-                    )
-                    ack = json.loads(await ws.recv())
+                # Pipeline the subscribe batches: send them all, then collect
+                # one ack per batch, so setup costs one round-trip.
+                frames = self._subscribe_frames(
+                    symbols, max_symbols_per_call, subscribe_frames
+                )
+                for frame in frames:
+                    await ws.send(frame)
+                for _ in frames:
+                    ack = decode(await ws.recv())
                     if ack.get("type") == "error":
                         raise SahmkError(
                             f"Subscribe error: {ack.get('message')}",
                             status_code=ack.get("code"),
                         )
 
-                async def _ping_loop():
-                    while True:
-                        await asyncio.sleep(ping_interval)
-                        try:
-                            await ws.send(json.dumps({"action": "ping"}))
-                        except Exception:
-                            break
-
-                ping_task = asyncio.create_task(_ping_loop())
-
-                try:
-                    async for message in ws:
-                        data = json.loads(message)
-                        msg_type = data.get("type")
-
-                        if msg_type == "quote" and on_quote:
-                            await on_quote(data)
-                        elif msg_type == "error":
-                            if on_error:
-                                await on_error(data)
-                            else:
-                                logger.warning(
-                                    "WebSocket error (unhandled): %s",
-                                    data.get("message", data),
-                                )
-
-                    raise ConnectionError("WebSocket connection closed by server")
-                finally:
-                    ping_task.cancel()
+                async def _handle(data):
+                    msg_type = data.get("type")
+
+                    if msg_type == "quote" and on_quote:
+                        await on_quote(data)
+                    elif msg_type == "error":
+                        if on_error:
+                            await on_error(data)
+                        else:
+                            logger.warning(
+                                "WebSocket error (unhandled): %s",
+                                data.get("message", data),
+                            )
+
+                await self._dispatch_ws_messages(
+                    ws, _handle, on_healthy=on_healthy, decode=decode
+                )
         except websockets.exceptions.ConnectionClosed as exc:
             close_frame = getattr(exc, "rcvd", None) or getattr(exc, "sent", None)
             close_code = getattr(close_frame, "code", None)
@@ -1077,6 +1667,99 @@ class SahmkClient:
                 f"(code={close_code}, reason={close_reason or 'N/A'})"
             )
 
+    async def _dispatch_ws_messages(self, ws, handle, on_healthy=None, decode=_json_loads):
+        """
+        Pump decoded frames from `ws` into `handle` through a bounded queue.
+
+        A background task keeps receiving while `handle` runs, so a slow
+        callback does not stall the socket (up to _WS_MESSAGE_QUEUE_SIZE
+        buffered messages, after which the reader waits for the consumer).
+        `on_healthy()` is called once, when the first streamed frame arrives.
+        Raises ConnectionError on a clean server close and re-raises any
+        receive error (e.g. ConnectionClosed) in the caller's context.
+        """
+        import asyncio
+
+        queue = asyncio.Queue(maxsize=_WS_MESSAGE_QUEUE_SIZE)
+
+        async def _reader():
+            try:
+                async for message in ws:
+                    await queue.put(decode(message))
+            except Exception as exc:
+                await queue.put(exc)
+            else:
+                await queue.put(_WS_STREAM_CLOSED)
+
+        reader = asyncio.create_task(_reader())
+        try:
+            while True:
+                item = await queue.get()
+                if item is _WS_STREAM_CLOSED:
+                    raise ConnectionError("WebSocket connection closed by server")
+                if isinstance(item, Exception):
+                    raise item
+                if on_healthy is not None:
+                    on_healthy()
+                    on_healthy = None
+                await handle(item)
+        finally:
+            reader.cancel()
+
+    @staticmethod
+    def _subscribe_frames(symbols, max_symbols_per_call, cache=None, **extra):
+        """
+        Return serialized subscribe messages for `symbols`, one per batch.
+
+        When `cache` (a dict owned by the calling stream) is given, frames are
+        built once per batch size and symbol list and reused on every reconnect.
+        """
+        key = (max_symbols_per_call, tuple(symbols))
+        if cache is not None and key in cache:
+            return cache[key]
+        frames = [
+            _json_dumps(
+                {
+                    "action": "subscribe",
+                    "symbols": symbols[i : i + max_symbols_per_call],
+                    **extra,
+                }
+            )
+            for i in range(0, len(symbols), max_symbols_per_call)
+        ]
+        if cache is not None:
+            cache[key] = frames
+        return frames
+
+    @staticmethod
+    def _ws_frame_decoder(wire_format):
+        """Return the frame decoder for a stream `wire_format` ("json" or "msgpack")."""
+        if wire_format == "json":
+            return _json_loads
+        if wire_format != "msgpack":
+            raise ValueError('wire_format must be "json" or "msgpack"')
+        try:
+            import msgpack
+        except ImportError:
+            raise SahmkError(
+                "msgpack package required for wire_format='msgpack'. "
+                'Install it with: pip install "sahmk[msgpack]"'
+            )
+
+        def decode(frame):
+            if isinstance(frame, (bytes, bytearray, memoryview)):
+                return msgpack.unpackb(frame, raw=False)
+            return _json_loads(frame)
+
+        return decode
+
+    @staticmethod
+    def _ws_keepalive_options(ping_interval):
+        """Map `ping_interval` to websockets' protocol-level keep-alive options."""
+        if not ping_interval:
+            return {"ping_interval": None, "ping_timeout": None}
+        return {"ping_interval": ping_interval, "ping_timeout": ping_interval * 2}
+
     async def stream_depth(
         self,
         symbols,
@@ -1106,8 +1789,13 @@ class SahmkClient:
             on_reconnect: Async callback — on_reconnect(attempt)
             levels: Optional book levels to request (1-20). Entitlement may
                     cap the served depth below this value.
-            ping_interval: Seconds between keep-alive pings (default: 30)
-            max_reconnect_attempts: Maximum reconnection attempts. 0 means
+            ping_interval: Seconds between WebSocket protocol pings. The
+                           connection is treated as dead when no pong
+                           arrives within twice this interval. None
+                           disables keep-alive pings. (default: 30)
+            max_reconnect_attempts: Maximum consecutive reconnection attempts.
+                                    The count (and backoff delay) resets once a
+                                    reconnected stream delivers data. 0 means
                                     unlimited reconnection (default). Set to -1
                                     to disable reconnection entirely.
             initial_reconnect_delay: Initial delay before first reconnect.
@@ -1130,8 +1818,7 @@ class SahmkClient:
 
         import asyncio
 
-        if isinstance(symbols, str):
-            symbols = [symbols]
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
         if not symbols:
             raise ValueError("At least one symbol is required")
 
@@ -1139,6 +1826,12 @@ class SahmkClient:
         reconnect_enabled = max_reconnect_attempts != -1
         attempt = 0
         delay = initial_reconnect_delay
+        subscribe_frames = {}
+
+        def _reset_backoff():
+            nonlocal attempt, delay
+            attempt = 0
+            delay = initial_reconnect_delay
 
         while True:
             try:
@@ -1148,6 +1841,8 @@ class SahmkClient:
                     on_error=on_error,
                     levels=normalized_levels,
                     ping_interval=ping_interval,
+                    on_healthy=_reset_backoff,
+                    subscribe_frames=subscribe_frames,
                 )
                 return
             except SahmkError:
@@ -1201,16 +1896,17 @@ class SahmkClient:
         on_error=None,
         levels=None,
         ping_interval=30,
+        on_healthy=None,
+        subscribe_frames=None,
     ):
         """Single depth WebSocket connection lifecycle: connect, subscribe, listen."""
-        import asyncio
         import websockets
 
         url = f"{DEPTH_WS_URL}?api_key={self.api_key}"
 
         try:
-            async with websockets.connect(url) as ws:
-                msg = json.loads(await ws.recv())
+            async with websockets.connect(url, **self._ws_keepalive_options(ping_interval)) as ws:
+                msg = _json_loads(await ws.recv())
                 if msg.get("type") == "error":
                     raise SahmkError(
                         f"WebSocket error: {msg.get('message')}",
@@ -1236,47 +1932,34 @@ class SahmkClient:
                     limits.get("max_symbols_per_call") or _DEFAULT_WS_MAX_SYMBOLS_PER_CALL
                 )
 
-                for i in range(0, len(symbols), max_symbols_per_call):
-                    batch = symbols[i : i + max_symbols_per_call]
-                    payload = {"action": "subscribe", "symbols": batch}
-                    if levels is not None:
-                        payload["levels"] = levels
-                    await ws.send(json.dumps(payload))
+                extra = {"levels": levels} if levels is not None else {}
+                frames = self._subscribe_frames(
+                    symbols, max_symbols_per_call, subscribe_frames, **extra
+                )
+                for frame in frames:
+                    await ws.send(frame)
+                for _ in frames:
                     await self._await_depth_subscribe_ack(
                         ws,
                         on_depth=on_depth,
                         on_error=on_error,
                     )
 
-                async def _ping_loop():
-                    while True:
-                        await asyncio.sleep(ping_interval)
-                        try:
-                            await ws.send(json.dumps({"action": "ping"}))
-                        except Exception:
-                            break
-
-                ping_task = asyncio.create_task(_ping_loop())
-
-                try:
-                    async for message in ws:
-                        data = json.loads(message)
-                        msg_type = data.get("type")
-
-                        if msg_type == "depth_snapshot" and on_depth:
-                            await on_depth(data)
-                        elif msg_type == "error":
-                            if on_error:
-                                await on_error(data)
-                            else:
-                                logger.warning(
-                                    "Depth WebSocket error (unhandled): %s",
-                                    data.get("message", data),
-                                )
-
-                    raise ConnectionError("WebSocket connection closed by server")
-                finally:
-                    ping_task.cancel()
+                async def _handle(data):
+                    msg_type = data.get("type")
+
+                    if msg_type == "depth_snapshot" and on_depth:
+                        await on_depth(data)
+                    elif msg_type == "error":
+                        if on_error:
+                            await on_error(data)
+                        else:
+                            logger.warning(
+                                "Depth WebSocket error (unhandled): %s",
+                                data.get("message", data),
+                            )
+
+                await self._dispatch_ws_messages(ws, _handle, on_healthy=on_healthy)
         except websockets.exceptions.ConnectionClosed as exc:
             close_frame = getattr(exc, "rcvd", None) or getattr(exc, "sent", None)
             close_code = getattr(close_frame, "code", None)
@@ -1297,7 +1980,7 @@ class SahmkClient:
     async def _await_depth_subscribe_ack(self, ws, on_depth=None, on_error=None):
         """Drain post-subscribe messages until subscribed/error acknowledgement."""
         while True:
-            data = json.loads(await ws.recv())
+            data = _json_loads(await ws.recv())
             msg_type = data.get("type")
 
             if msg_type == "depth_snapshot":
@@ -1365,8 +2048,13 @@ class SahmkClient:
             on_error: Async callback — on_error(error_data)
             on_disconnect: Async callback — on_disconnect(reason)
             on_reconnect: Async callback — on_reconnect(attempt)
-            ping_interval: Seconds between keep-alive pings (default: 30)
-            max_reconnect_attempts: Maximum reconnection attempts. 0 means
+            ping_interval: Seconds between WebSocket protocol pings. The
+                           connection is treated as dead when no pong
+                           arrives within twice this interval. None
+                           disables keep-alive pings. (default: 30)
+            max_reconnect_attempts: Maximum consecutive reconnection attempts.
+                                    The count (and backoff delay) resets once a
+                                    reconnected stream delivers data. 0 means
                                     unlimited reconnection (default). Set to -1
                                     to disable reconnection entirely.
             initial_reconnect_delay: Initial delay before first reconnect.
@@ -1389,14 +2077,19 @@ class SahmkClient:
 
         import asyncio
 
-        if isinstance(symbols, str):
-            symbols = [symbols]
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
         if not symbols:
             raise ValueError("At least one symbol is required")
 
         reconnect_enabled = max_reconnect_attempts != -1
         attempt = 0
         delay = initial_reconnect_delay
+        subscribe_frames = {}
+
+        def _reset_backoff():
+            nonlocal attempt, delay
+            attempt = 0
+            delay = initial_reconnect_delay
 
         while True:
             try:
@@ -1406,6 +2099,8 @@ class SahmkClient:
                     on_snapshot=on_snapshot,
                     on_error=on_error,
                     ping_interval=ping_interval,
+                    on_healthy=_reset_backoff,
+                    subscribe_frames=subscribe_frames,
                 )
                 return
             except SahmkError:
@@ -1459,16 +2154,17 @@ class SahmkClient:
         on_snapshot=None,
         on_error=None,
         ping_interval=30,
+        on_healthy=None,
+        subscribe_frames=None,
     ):
         """Single trades WebSocket connection lifecycle: connect, subscribe, listen."""
-        import asyncio
         import websockets
 
         url = f"{TRADES_WS_URL}?api_key={self.api_key}"
 
         try:
-            async with websockets.connect(url) as ws:
-                msg = json.loads(await ws.recv())
+            async with websockets.connect(url, **self._ws_keepalive_options(ping_interval)) as ws:
+                msg = _json_loads(await ws.recv())
                 if msg.get("type") == "error":
                     raise SahmkError(
                         f"WebSocket error: {msg.get('message')}",
@@ -1494,11 +2190,12 @@ class SahmkClient:
                     limits.get("max_symbols_per_call") or _DEFAULT_WS_MAX_SYMBOLS_PER_CALL
                 )
 
-                for i in range(0, len(symbols), max_symbols_per_call):
-                    batch = symbols[i : i + max_symbols_per_call]
-                    await ws.send(
-                        json.dumps({"action": "subscribe", "symbols": batch})
-                    )
+                frames = self._subscribe_frames(
+                    symbols, max_symbols_per_call, subscribe_frames
+                )
+                for frame in frames:
+                    await ws.send(frame)
+                for _ in frames:
                     await self._await_trades_subscribe_ack(
                         ws,
                         on_trade=on_trade,
@@ -1506,37 +2203,23 @@ class SahmkClient:
                         on_error=on_error,
                     )
 
-                async def _ping_loop():
-                    while True:
-                        await asyncio.sleep(ping_interval)
-                        try:
-                            await ws.send(json.dumps({"action": "ping"}))
-                        except Exception:
-                            break
-
-                ping_task = asyncio.create_task(_ping_loop())
-
-                try:
-                    async for message in ws:
-                        data = json.loads(message)
-                        msg_type = data.get("type")
-
-                        if msg_type == "trade" and on_trade:
-                            await on_trade(data)
-                        elif msg_type == "trades_snapshot" and on_snapshot:
-                            await on_snapshot(data)
-                        elif msg_type == "error":
-                            if on_error:
-                                await on_error(data)
-                            else:
-                                logger.warning(
-                                    "Trades WebSocket error (unhandled): %s",
-                                    data.get("message", data),
-                                )
-
-                    raise ConnectionError("WebSocket connection closed by server")
-                finally:
-                    ping_task.cancel()
+                async def _handle(data):
+                    msg_type = data.get("type")
+
+                    if msg_type == "trade" and on_trade:
+                        await on_trade(data)
+                    elif msg_type == "trades_snapshot" and on_snapshot:
+                        await on_snapshot(data)
+                    elif msg_type == "error":
+                        if on_error:
+                            await on_error(data)
+                        else:
+                            logger.warning(
+                                "Trades WebSocket error (unhandled): %s",
+                                data.get("message", data),
+                            )
+
+                await self._dispatch_ws_messages(ws, _handle, on_healthy=on_healthy)
         except websockets.exceptions.ConnectionClosed as exc:
             close_frame = getattr(exc, "rcvd", None) or getattr(exc, "sent", None)
             close_code = getattr(close_frame, "code", None)
@@ -1563,7 +2246,7 @@ class SahmkClient:
     ):
         """Drain post-subscribe messages until subscribed/error acknowledgement."""
         while True:
-            data = json.loads(await ws.recv())
+            data = _json_loads(await ws.recv())
             msg_type = data.get("type")
 
             if msg_type == "trades_snapshot":
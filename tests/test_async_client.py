@@ -0,0 +1,298 @@
+"""Tests for the aiohttp-based AsyncSahmkClient."""
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from sahmk import (  # noqa: E402
+    AsyncSahmkClient,
+    MarketMoversResponse,
+    Quote,
+    SahmkError,
+    SahmkRateLimitError,
+)
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp ClientResponse context manager."""
+
+    def __init__(self, status=200, payload=None, body=None, headers=None, delay=0):
+        self.status = status
+        self.headers = headers or {}
+        if body is None:
+            body = json.dumps(payload if payload is not None else {}).encode()
+        self._body = body
+        self._delay = delay
+
+    async def __aenter__(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+class RaisingResponse:
+    """Context manager that raises when entered (connection-level failure)."""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+    async def __aenter__(self):
+        raise self.exc
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeSession:
+    """Replays canned responses and records request calls."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+
+    def request(self, method, url, params=None):
+        self.calls.append((method, url, params))
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def async_client(api_key, mock_base_url):
+    """AsyncSahmkClient with retries disabled for speed."""
+    return AsyncSahmkClient(api_key=api_key, base_url=mock_base_url, retries=0)
+
+
+class TestAsyncClientInit:
+    """Tests for AsyncSahmkClient construction and session lifecycle."""
+
+    def test_session_created_lazily(self, async_client):
+        assert async_client.session is None
+
+    def test_missing_aiohttp_raises(self, api_key):
+        with mock.patch.dict("sys.modules", {"aiohttp": None}):
+            with pytest.raises(SahmkError) as exc_info:
+                AsyncSahmkClient(api_key)
+        assert "aiohttp package required" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_get_session_configures_pool_and_headers(self, async_client):
+        session = async_client._get_session()
+        try:
+            assert isinstance(session, aiohttp.ClientSession)
+            assert session.headers["X-API-Key"] == async_client.api_key
+            assert session.connector.limit == 100
+            assert session.connector.limit_per_host == 20
+            assert async_client._get_session() is session
+        finally:
+            await async_client.close()
+        assert async_client.session is None
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_session(self, api_key):
+        async with AsyncSahmkClient(api_key) as client:
+            session = client._get_session()
+        assert session.closed
+
+    def test_parallel_not_supported(self, async_client):
+        with pytest.raises(TypeError) as exc_info:
+            async_client.parallel(async_client.market_summary)
+        assert "asyncio.gather" in str(exc_info.value)
+
+
+class TestAsyncClientRequests:
+    """Tests for async REST requests."""
+
+    @pytest.mark.asyncio
+    async def test_quote_returns_model(self, async_client, sample_quote_response):
+        async_client.session = FakeSession([FakeResponse(payload=sample_quote_response)])
+
+        quote = await async_client.quote("2222")
+
+        assert isinstance(quote, Quote)
+        assert quote.price == 32.45
+        method, url, params = async_client.session.calls[0]
+        assert method == "GET"
+        assert url == f"{async_client.base_url}/quote/2222/"
+        assert params is None
+
+    @pytest.mark.asyncio
+    async def test_market_params_forwarded(self, async_client, sample_gainers_response):
+        async_client.session = FakeSession([FakeResponse(payload=sample_gainers_response)])
+
+        result = await async_client.gainers(limit=5, index="NOMUC")
+
+        assert isinstance(result, MarketMoversResponse)
+        assert async_client.session.calls[0][2] == {"limit": 5, "index": "NOMU"}
+
+    @pytest.mark.asyncio
+    async def test_boolean_params_encoded_like_requests(self, async_client):
+        async_client.session = FakeSession([FakeResponse(payload={"symbol": "2222"})])
+
+        await async_client.financials("2222", include_partial=True)
+
+        assert async_client.session.calls[0][2] == {"include_partial": "True"}
+
+    @pytest.mark.asyncio
+    async def test_gather_runs_requests_concurrently(
+        self, async_client, sample_market_summary_response
+    ):
+        async_client.session = FakeSession(
+            [
+                FakeResponse(payload=sample_market_summary_response, delay=0.1)
+                for _ in range(4)
+            ]
+        )
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(
+            *(async_client.market_summary() for _ in range(4))
+        )
+        elapsed = loop.time() - started
+
+        assert len(results) == 4
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_quotes_falls_back_to_symbols_param(
+        self, async_client, sample_quotes_response
+    ):
+        legacy_error = {"error": {"code": "VALIDATION", "message": "symbols is required"}}
+        async_client.session = FakeSession(
+            [
+                FakeResponse(status=400, payload=legacy_error),
+                FakeResponse(payload=sample_quotes_response),
+            ]
+        )
+
+        result = await async_client.quotes(["2222", "1120"])
+
+        assert result.count == 2
+        assert async_client.session.calls[0][2] == {"identifiers": "1120,2222"}
+        assert async_client.session.calls[1][2] == {"symbols": "1120,2222"}
+
+    @pytest.mark.asyncio
+    async def test_historical_iter_yields_bars(
+        self, async_client, sample_historical_response
+    ):
+        async_client.session = FakeSession([FakeResponse(payload=sample_historical_response)])
+
+        bars = [bar async for bar in async_client.historical_iter("2222")]
+
+        assert [bar.date for bar in bars] == ["2024-01-01", "2024-01-02"]
+
+    @pytest.mark.asyncio
+    async def test_api_error_raises_sahmk_error(self, async_client):
+        error = {"error": {"code": "PLAN_LIMIT", "message": "Upgrade required"}}
+        async_client.session = FakeSession([FakeResponse(status=403, payload=error)])
+
+        with pytest.raises(SahmkError) as exc_info:
+            await async_client.historical("2222")
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.error_code == "PLAN_LIMIT"
+
+    @pytest.mark.asyncio
+    async def test_non_json_response(self, async_client):
+        async_client.session = FakeSession([FakeResponse(body=b"<html>oops</html>")])
+
+        with pytest.raises(SahmkError) as exc_info:
+            await async_client.market_summary()
+
+        assert "Unexpected non-JSON response" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_connection_error_wrapped(self, async_client):
+        async_client.session = FakeSession(
+            [RaisingResponse(aiohttp.ClientConnectionError("refused"))]
+        )
+
+        with pytest.raises(SahmkError) as exc_info:
+            await async_client.quote("2222")
+
+        assert "Request failed" in str(exc_info.value)
+
+
+class TestAsyncClientRetry:
+    """Tests for async retry behavior."""
+
+    @pytest.mark.asyncio
+    async def test_retries_on_500_then_succeeds(self, api_key, sample_quote_response):
+        client = AsyncSahmkClient(api_key, retries=2, backoff_factor=0)
+        client.session = FakeSession(
+            [
+                FakeResponse(status=500, payload={}),
+                FakeResponse(payload=sample_quote_response),
+            ]
+        )
+
+        quote = await client.quote("2222")
+
+        assert quote.symbol == "2222"
+        assert len(client.session.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_on_timeout(self, api_key, sample_quote_response):
+        client = AsyncSahmkClient(api_key, retries=1, backoff_factor=0)
+        client.session = FakeSession(
+            [
+                RaisingResponse(asyncio.TimeoutError()),
+                FakeResponse(payload=sample_quote_response),
+            ]
+        )
+
+        quote = await client.quote("2222")
+
+        assert quote.symbol == "2222"
+
+    @pytest.mark.asyncio
+    async def test_429_raises_rate_limit_error(self, async_client):
+        async_client.session = FakeSession(
+            [
+                FakeResponse(
+                    status=429,
+                    payload={},
+                    headers={"Retry-After": "5", "X-RateLimit-Remaining": "0"},
+                )
+            ]
+        )
+
+        with pytest.raises(SahmkRateLimitError) as exc_info:
+            await async_client.quote("2222")
+
+        assert exc_info.value.retry_after == 5.0
+        assert exc_info.value.rate_remaining == 0
+
+
+class TestAsyncQuoteBatched:
+    """Tests for coalesced quotes on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(
+        self, async_client, sample_quotes_response
+    ):
+        async_client.session = FakeSession([FakeResponse(payload=sample_quotes_response)])
+
+        aramco, rajhi = await asyncio.gather(
+            async_client.quote_batched("2222"),
+            async_client.quote_batched("1120"),
+        )
+
+        assert aramco.symbol == "2222"
+        assert rajhi.symbol == "1120"
+        assert async_client.session.calls == [
+            ("GET", f"{async_client.base_url}/quotes/", {"identifiers": "1120,2222"})
+        ]
@@ -0,0 +1,134 @@
+"""Tests for the in-process TTL cache and its use by SahmkClient."""
+
+from unittest import mock
+
+import responses
+
+from sahmk import SahmkClient
+from sahmk._cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for the TTLCache container."""
+
+    def test_get_missing_returns_none(self):
+        assert TTLCache(ttl=1).get("missing") is None
+
+    def test_set_then_get(self):
+        cache = TTLCache(ttl=1)
+        cache.set("k", {"price": 1})
+        assert cache.get("k") == {"price": 1}
+
+    def test_entries_expire(self):
+        cache = TTLCache(ttl=2)
+        with mock.patch("sahmk._cache.time.monotonic", return_value=100.0):
+            cache.set("k", {"price": 1})
+        with mock.patch("sahmk._cache.time.monotonic", return_value=101.9):
+            assert cache.get("k") == {"price": 1}
+        with mock.patch("sahmk._cache.time.monotonic", return_value=102.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_returned_values_are_copies(self):
+        cache = TTLCache(ttl=10)
+        original = {"data": [{"price": 1}]}
+        cache.set("k", original)
+        original["data"].append({"price": 2})
+
+        first = cache.get("k")
+        first["data"][0]["price"] = 99
+
+        assert cache.get("k") == {"data": [{"price": 1}]}
+
+    def test_maxsize_evicts_oldest(self):
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set("a", {})
+        cache.set("b", {})
+        cache.set("c", {})
+        assert cache.get("a") is None
+        assert cache.get("b") == {}
+        assert cache.get("c") == {}
+
+    def test_clear(self):
+        cache = TTLCache(ttl=10)
+        cache.set("a", {})
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestClientResponseCache:
+    """Tests for caching GET responses on SahmkClient."""
+
+    @responses.activate
+    def test_cache_disabled_by_default(self, mock_client, sample_quote_response):
+        url = f"{mock_client.base_url}/quote/2222/"
+        responses.add(responses.GET, url, json=sample_quote_response)
+
+        mock_client.quote("2222")
+        mock_client.quote("2222")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_repeat_get_served_from_cache(
+        self, api_key, mock_base_url, sample_market_summary_response
+    ):
+        client = SahmkClient(api_key, base_url=mock_base_url, cache_ttl=60)
+        responses.add(
+            responses.GET,
+            f"{mock_base_url}/market/summary/",
+            json=sample_market_summary_response,
+        )
+
+        first = client.market_summary(index="TASI")
+        second = client.market_summary(index="TASI")
+
+        assert len(responses.calls) == 1
+        assert first.raw == second.raw
+        assert first.raw is not second.raw
+
+    @responses.activate
+    def test_cache_key_includes_params(
+        self, api_key, mock_base_url, sample_gainers_response
+    ):
+        client = SahmkClient(api_key, base_url=mock_base_url, cache_ttl=60)
+        responses.add(
+            responses.GET,
+            f"{mock_base_url}/market/gainers/",
+            json=sample_gainers_response,
+        )
+
+        client.gainers(limit=5)
+        client.gainers(limit=10)
+        client.gainers(limit=5)
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_errors_are_not_cached(self, api_key, mock_base_url, sample_quote_response):
+        client = SahmkClient(api_key, base_url=mock_base_url, retries=0, cache_ttl=60)
+        url = f"{mock_base_url}/quote/2222/"
+        responses.add(responses.GET, url, json={"error": {"code": "X"}}, status=400)
+        responses.add(responses.GET, url, json=sample_quote_response)
+
+        try:
+            client.quote("2222")
+        except Exception:
+            pass
+        quote = client.quote("2222")
+
+        assert quote.price == sample_quote_response["price"]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_clear_cache_forces_refetch(self, api_key, mock_base_url, sample_quote_response):
+        client = SahmkClient(api_key, base_url=mock_base_url, cache_ttl=60)
+        responses.add(
+            responses.GET, f"{mock_base_url}/quote/2222/", json=sample_quote_response
+        )
+
+        client.quote("2222")
+        client.clear_cache()
+        client.quote("2222")
+
+        assert len(responses.calls) == 2
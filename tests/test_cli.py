@@ -8,7 +8,7 @@ from unittest import mock
 
 import pytest
 import responses
-from sahmk.cli import main, _build_parser, _resolve_api_key, _print_json, _run_stream
+from sahmk.cli import main, _build_parser, _resolve_api_key, _print_json, _run_async, _run_stream
 from sahmk.client import SahmkError
 
 
@@ -926,3 +926,36 @@ class TestParserNewCommands:
         assert args.command == "compare"
         assert args.symbols == "2222,1120"
         assert args.metrics == "extended"
+
+
+class TestRunAsync:
+    """Tests for the CLI event-loop runner."""
+
+    def test_uses_uvloop_when_installed(self):
+        fake_uvloop = mock.MagicMock()
+        fake_uvloop.run.return_value = "ran"
+
+        async def coro():
+            return None
+
+        awaitable = coro()
+        with mock.patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+            assert _run_async(awaitable) == "ran"
+        fake_uvloop.run.assert_called_once_with(awaitable)
+        awaitable.close()
+
+    def test_falls_back_to_asyncio_on_old_uvloop(self):
+        fake_uvloop = mock.Mock(spec=[])  # uvloop<0.18 has no run()
+
+        async def coro():
+            return 42
+
+        with mock.patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+            assert _run_async(coro()) == 42
+
+    def test_falls_back_to_asyncio(self):
+        async def coro():
+            return 42
+
+        with mock.patch.dict("sys.modules", {"uvloop": None}):
+            assert _run_async(coro()) == 42
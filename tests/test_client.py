@@ -1,5 +1,13 @@
 """Unit tests for the SahmkClient class."""
 
+import asyncio
+import json
+import os
+import signal
+import weakref
+from collections import OrderedDict
+from unittest import mock
+
 import pytest
 import requests
 import responses
@@ -10,7 +18,8 @@ from sahmk import (
     SahmkAmbiguousIdentifierError,
     SahmkUnknownIdentifierError,
 )
-from sahmk.client import SahmkError, BASE_URL, WS_URL
+import sahmk.client as client_module
+from sahmk.client import SahmkError, BASE_URL, WS_URL, _json_dumps, _json_loads
 
 
 class TestClientInitialization:
@@ -37,11 +46,80 @@ class TestClientInitialization:
         client = SahmkClient(api_key=api_key, base_url=url_with_slash)
         assert client.base_url == "https://api.sahmk.sa/api/v1"
 
+    def test_fixed_endpoint_urls_precomputed(self, api_key):
+        """Test fixed endpoints resolve from the precomputed URL table."""
+        client = SahmkClient(api_key=api_key, base_url="https://api.test/v1/")
+        assert client._urls["/market/gainers/"] == "https://api.test/v1/market/gainers/"
+        assert client._url("/market/gainers/") is client._urls["/market/gainers/"]
+        assert client._url("/quote/2222/") == "https://api.test/v1/quote/2222/"
+
+    def test_reassigning_base_url_refreshes_fixed_endpoint_urls(self, api_key):
+        """Test fixed and per-symbol endpoints follow a reassigned base URL."""
+        client = SahmkClient(api_key=api_key)
+        client.base_url = "http://localhost:9"
+        assert client._url("/market/summary/") == "http://localhost:9/market/summary/"
+        assert client._url("/quote/1/") == "http://localhost:9/quote/1/"
+
     def test_client_init_with_custom_timeout(self, api_key):
         """Test client initializes with custom timeout."""
         client = SahmkClient(api_key=api_key, timeout=60)
         assert client.timeout == 60
 
+    def test_client_uses_slots(self, api_key):
+        """Test client attributes live in __slots__ (no per-instance __dict__)."""
+        client = SahmkClient(api_key=api_key)
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = 1
+
+    def test_client_supports_weakref(self, api_key):
+        """Test slotted clients can still be weakly referenced."""
+        client = SahmkClient(api_key=api_key)
+        assert weakref.ref(client)() is client
+
+    def test_client_methods_patchable_on_class(self, api_key):
+        """Test methods are patched on the class, not the slotted instance."""
+        client = SahmkClient(api_key=api_key)
+        with pytest.raises(AttributeError):
+            with mock.patch.object(client, "quote"):
+                pass
+        with mock.patch.object(SahmkClient, "quote", return_value="patched"):
+            assert client.quote("2222") == "patched"
+
+    def test_clients_with_same_key_share_session(self, api_key):
+        """Test clients reuse one pooled session per API key."""
+        first = SahmkClient(api_key=api_key)
+        second = SahmkClient(api_key=api_key)
+        other = SahmkClient(api_key="other_key")
+        assert first.session is second.session
+        assert other.session is not first.session
+        assert other.session.headers["X-API-Key"] == "other_key"
+
+    def test_session_cache_evicts_least_recently_used_key(self, api_key):
+        """Test the shared-session cache is bounded per API key."""
+        with mock.patch.object(client_module, "_session_cache", OrderedDict()), \
+                mock.patch.object(client_module, "_SESSION_CACHE_MAX_KEYS", 2):
+            first = SahmkClient(api_key=api_key)
+            SahmkClient(api_key="key_a")
+            assert SahmkClient(api_key=api_key).session is first.session
+            SahmkClient(api_key="key_b")
+            assert SahmkClient(api_key=api_key).session is first.session
+            assert "key_a" not in client_module._session_cache
+            assert list(client_module._session_cache) == ["key_b", api_key]
+
+    def test_fork_reset_drops_shared_sessions(self, api_key):
+        """Test a forked child does not reuse the parent's pooled sessions."""
+        parent = SahmkClient(api_key=api_key)
+        client_module._reset_after_fork()
+        assert SahmkClient(api_key=api_key).session is not parent.session
+
+    def test_session_mounts_pooled_adapter(self, api_key):
+        """Test the shared session is mounted with a sized connection pool."""
+        adapter = SahmkClient(api_key=api_key).session.get_adapter("https://api.sahmk.sa")
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 20
+        assert adapter.max_retries.total == 0
+
 
 class TestClientRequestMethod:
     """Tests for the internal _request method."""
@@ -294,8 +372,8 @@ class TestQuotesEndpoint:
 
         request = responses.calls[0].request
         assert (
-            "identifiers=2222%2C1120" in request.url
-            or "identifiers=2222,1120" in request.url
+            "identifiers=1120%2C2222" in request.url
+            or "identifiers=1120,2222" in request.url
         )
 
     @responses.activate
@@ -312,10 +390,44 @@ class TestQuotesEndpoint:
         
         request = responses.calls[0].request
         assert (
-            "identifiers=2222%2C1120%2C2010" in request.url
-            or "identifiers=2222,1120,2010" in request.url
+            "identifiers=1120%2C2010%2C2222" in request.url
+            or "identifiers=1120,2010,2222" in request.url
+        )
+
+    @responses.activate
+    def test_quotes_canonical_query_and_caller_order(
+        self, mock_client, sample_quotes_response
+    ):
+        """Test equivalent batches share one query string; results follow caller order."""
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/quotes/",
+            json=sample_quotes_response,
+            status=200,
         )
 
+        first = mock_client.quotes(["2222", "1120"])
+        second = mock_client.quotes(["1120", "2222", "1120"])
+
+        assert responses.calls[0].request.url == responses.calls[1].request.url
+        assert [q.symbol for q in first.quotes] == ["2222", "1120"]
+        assert [q.symbol for q in second.quotes] == ["1120", "2222"]
+        assert [q["symbol"] for q in second["quotes"]] == ["1120", "2222"]
+
+    @responses.activate
+    def test_quotes_unmatched_quotes_kept(self, mock_client):
+        """Test quotes resolved from names the response does not echo are not dropped."""
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/quotes/",
+            json={"quotes": [{"symbol": "1120"}, {"symbol": "2222"}], "count": 2},
+            status=200,
+        )
+
+        result = mock_client.quotes(["2222", "Al Rajhi"])
+
+        assert [q.symbol for q in result.quotes] == ["2222", "1120"]
+
     @responses.activate
     def test_quotes_multiple_identifier_types(self, mock_client):
         """Test batch quotes with symbol, Arabic name, and English alias."""
@@ -481,6 +593,164 @@ class TestQuotesEndpoint:
             assert result is not None
 
 
+class TestQuoteBatched:
+    """Tests for coalesced single-symbol quotes."""
+
+    @pytest.mark.asyncio
+    @responses.activate
+    async def test_concurrent_calls_share_one_request(
+        self, mock_client, sample_quotes_response
+    ):
+        """Concurrent quote_batched calls are merged into one /quotes/ request."""
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/quotes/",
+            json=sample_quotes_response,
+            status=200,
+        )
+
+        aramco, rajhi, aramco_again = await asyncio.gather(
+            mock_client.quote_batched("2222"),
+            mock_client.quote_batched("1120"),
+            mock_client.quote_batched("2222"),
+        )
+
+        assert len(responses.calls) == 1
+        assert "1120%2C2222" in responses.calls[0].request.url
+        assert aramco.symbol == "2222"
+        assert aramco_again.symbol == "2222"
+        assert rajhi.price == 88.20
+
+    @pytest.mark.asyncio
+    @responses.activate
+    async def test_missing_symbol_raises_unknown_identifier(
+        self, mock_client, sample_quotes_response
+    ):
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/quotes/",
+            json=sample_quotes_response,
+            status=200,
+        )
+
+        found, missing = await asyncio.gather(
+            mock_client.quote_batched("2222"),
+            mock_client.quote_batched("9999"),
+            return_exceptions=True,
+        )
+
+        assert found.symbol == "2222"
+        assert isinstance(missing, SahmkUnknownIdentifierError)
+        assert missing.identifier == "9999"
+
+    @pytest.mark.asyncio
+    @responses.activate
+    async def test_batch_error_propagates_to_all_callers(self, mock_client):
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/quotes/",
+            json={"error": {"code": "PLAN_LIMIT", "message": "Starter+ required"}},
+            status=403,
+        )
+
+        results = await asyncio.gather(
+            mock_client.quote_batched("2222"),
+            mock_client.quote_batched("1120"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, SahmkError) for r in results)
+        assert all(r.status_code == 403 for r in results)
+        assert len(responses.calls) == 1
+
+    @pytest.mark.asyncio
+    @responses.activate
+    async def test_flushes_early_at_batch_limit(self, mock_client):
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/quotes/",
+            json={"quotes": [{"symbol": str(i)} for i in range(60)]},
+            status=200,
+        )
+
+        results = await asyncio.gather(
+            *(mock_client.quote_batched(str(i)) for i in range(60))
+        )
+
+        assert [r.symbol for r in results] == [str(i) for i in range(60)]
+        assert len(responses.calls) == 2
+
+
+class TestParallel:
+    """Tests for thread-pool fan-out of independent calls."""
+
+    @responses.activate
+    def test_results_returned_in_call_order(
+        self, mock_client, sample_market_summary_response, sample_gainers_response
+    ):
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/market/summary/",
+            json=sample_market_summary_response,
+        )
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/market/gainers/",
+            json=sample_gainers_response,
+        )
+
+        summary, gainers = mock_client.parallel(
+            mock_client.market_summary,
+            lambda: mock_client.gainers(limit=5),
+        )
+
+        assert summary["index_value"] == sample_market_summary_response["index_value"]
+        assert gainers.stocks[0].symbol == sample_gainers_response["gainers"][0]["symbol"]
+
+    def test_calls_run_concurrently(self, mock_client):
+        import time
+
+        started = time.monotonic()
+        results = mock_client.parallel(*(lambda i=i: time.sleep(0.1) or i for i in range(4)))
+        elapsed = time.monotonic() - started
+
+        assert results == [0, 1, 2, 3]
+        assert elapsed < 0.3
+
+    def test_exception_is_raised_by_default(self, mock_client):
+        def boom():
+            raise SahmkError("boom")
+
+        with pytest.raises(SahmkError, match="boom"):
+            mock_client.parallel(lambda: 1, boom)
+
+    def test_return_exceptions(self, mock_client):
+        error = SahmkError("boom")
+
+        def boom():
+            raise error
+
+        assert mock_client.parallel(lambda: 1, boom, return_exceptions=True) == [1, error]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_parallel_works_in_forked_child(self, mock_client):
+        assert mock_client.parallel(lambda: 1) == [1]
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            signal.alarm(5)
+            ok = False
+            try:
+                ok = mock_client.parallel(lambda: 2) == [2]
+            finally:
+                os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.WIFEXITED(status), f"child did not exit cleanly (status {status})"
+        assert os.WEXITSTATUS(status) == 0
+
+
 class TestHistoricalEndpoint:
     """Tests for the historical data endpoint."""
 
@@ -622,6 +892,81 @@ class TestHistoricalEndpoint:
         assert result.data[1].partial is True
 
 
+class TestHistoricalIter:
+    """Tests for streaming historical bars with ijson."""
+
+    @responses.activate
+    def test_yields_ohlcv_bars(self, mock_client, sample_historical_response):
+        pytest.importorskip("ijson")
+        from sahmk.models import OHLCV
+
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/historical/2222/",
+            json=sample_historical_response,
+        )
+
+        bars = list(mock_client.historical_iter("2222", from_date="2024-01-01", interval="1d"))
+
+        assert [bar.date for bar in bars] == ["2024-01-01", "2024-01-02"]
+        assert all(isinstance(bar, OHLCV) for bar in bars)
+        assert bars[0].close == 32.4
+        assert isinstance(bars[0].close, float)
+        request = responses.calls[0].request
+        assert "from=2024-01-01" in request.url
+        assert "interval=1d" in request.url
+
+    @responses.activate
+    def test_retries_before_streaming(self, api_key, mock_base_url, sample_historical_response):
+        pytest.importorskip("ijson")
+        client = SahmkClient(api_key, base_url=mock_base_url, retries=1, backoff_factor=0)
+        url = f"{mock_base_url}/historical/2222/"
+        responses.add(responses.GET, url, json={}, status=503)
+        responses.add(responses.GET, url, json=sample_historical_response)
+
+        bars = list(client.historical_iter("2222"))
+
+        assert len(bars) == 2
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_api_error_raised_on_first_iteration(self, mock_client):
+        pytest.importorskip("ijson")
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/historical/2222/",
+            json={"error": {"code": "PLAN_LIMIT", "message": "Upgrade required"}},
+            status=403,
+        )
+
+        with pytest.raises(SahmkError) as exc_info:
+            next(mock_client.historical_iter("2222"))
+
+        assert exc_info.value.error_code == "PLAN_LIMIT"
+
+    @responses.activate
+    def test_non_json_body(self, mock_client):
+        pytest.importorskip("ijson")
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/historical/2222/",
+            body="<html>oops</html>",
+        )
+
+        with pytest.raises(SahmkError) as exc_info:
+            list(mock_client.historical_iter("2222"))
+
+        assert "Unexpected non-JSON response" in str(exc_info.value)
+
+    def test_missing_ijson_raises(self, mock_client):
+        from unittest import mock
+
+        with mock.patch.dict("sys.modules", {"ijson": None}):
+            with pytest.raises(SahmkError) as exc_info:
+                next(mock_client.historical_iter("2222"))
+        assert "ijson package required" in str(exc_info.value)
+
+
 class TestMarketEndpoints:
     """Tests for market data endpoints."""
 
@@ -1228,6 +1573,20 @@ class TestEventsEndpoint:
         assert "symbol=2222" in request.url
         assert "limit=20" in request.url
 
+    @responses.activate
+    def test_events_omits_unset_params(self, mock_client, sample_events_response):
+        """Test unset/empty filters are not serialized into the query string."""
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/events/",
+            json=sample_events_response,
+            status=200,
+        )
+
+        mock_client.events(symbol="", limit=None)
+
+        assert responses.calls[0].request.url == f"{mock_client.base_url}/events/"
+
 
 class TestSahmkError:
     """Tests for the SahmkError exception class."""
@@ -1351,3 +1710,109 @@ class TestWebsocketURL:
         """Test that WS_URL is defined correctly."""
         assert WS_URL == "wss://api.sahmk.sa/ws/v1/stocks/"
         assert WS_URL.startswith("wss://")
+
+
+class TestJsonCodec:
+    """Tests for the JSON helpers used on REST and WebSocket payloads."""
+
+    def test_loads_accepts_bytes_and_text(self):
+        assert _json_loads(b'{"price": 32.45}') == {"price": 32.45}
+        assert _json_loads('{"symbol": "2222"}') == {"symbol": "2222"}
+
+    def test_loads_accepts_non_finite_numbers(self):
+        """Payloads with NaN (rejected by orjson) still parse via stdlib json."""
+        data = _json_loads(b'{"price": NaN}')
+        assert data["price"] != data["price"]
+
+    def test_loads_invalid_payload_raises_value_error(self):
+        with pytest.raises(ValueError):
+            _json_loads(b"<html>oops</html>")
+
+    def test_dumps_returns_text(self):
+        payload = _json_dumps({"action": "subscribe", "symbols": ["2222"]})
+        assert isinstance(payload, str)
+        assert json.loads(payload) == {"action": "subscribe", "symbols": ["2222"]}
+
+
+class TestHttp2Transport:
+    """Tests for the optional httpx-backed HTTP/2 transport."""
+
+    def _mock_session(self, client, handler):
+        httpx = pytest.importorskip("httpx")
+        client.session = httpx.Client(
+            headers={"X-API-Key": client.api_key},
+            transport=httpx.MockTransport(handler),
+        )
+        return httpx
+
+    def test_http2_session_is_httpx_client(self, api_key):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        client = SahmkClient(api_key=api_key, http2=True)
+        assert isinstance(client.session, httpx.Client)
+        assert client.session.headers["X-API-Key"] == api_key
+
+    def test_http2_missing_dependency(self, api_key):
+        from unittest import mock
+
+        with mock.patch.dict("sys.modules", {"httpx": None}):
+            with pytest.raises(SahmkError) as exc_info:
+                SahmkClient(api_key=api_key, http2=True)
+        assert "required for HTTP/2" in str(exc_info.value)
+
+    def test_http2_request_success(self, api_key, mock_base_url, sample_quote_response):
+        client = SahmkClient(api_key=api_key, base_url=mock_base_url, retries=0)
+        client.http2 = True
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json=sample_quote_response)
+
+        httpx = self._mock_session(client, handler)
+        result = client.financials("2222", include_partial=True, history=None)
+
+        assert result.raw == sample_quote_response
+        assert seen[0].url.params["include_partial"] == "True"
+        assert "history" not in seen[0].url.params
+
+    def test_http2_historical_iter(self, api_key, mock_base_url, sample_historical_response):
+        pytest.importorskip("ijson")
+        client = SahmkClient(api_key=api_key, base_url=mock_base_url, retries=0)
+        client.http2 = True
+
+        def handler(request):
+            return httpx.Response(200, json=sample_historical_response)
+
+        httpx = self._mock_session(client, handler)
+        bars = list(client.historical_iter("2222"))
+
+        assert [bar.date for bar in bars] == ["2024-01-01", "2024-01-02"]
+
+    def test_http2_error_mapping(self, api_key, mock_base_url):
+        client = SahmkClient(api_key=api_key, base_url=mock_base_url, retries=0)
+        client.http2 = True
+
+        def handler(request):
+            return httpx.Response(
+                404,
+                json={"error": {"code": "NOT_FOUND", "message": "Stock not found"}},
+            )
+
+        httpx = self._mock_session(client, handler)
+        with pytest.raises(SahmkError) as exc_info:
+            client.quote("9999")
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.error_code == "NOT_FOUND"
+
+    def test_http2_timeout_mapping(self, api_key, mock_base_url):
+        client = SahmkClient(api_key=api_key, base_url=mock_base_url, retries=0)
+        client.http2 = True
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        httpx = self._mock_session(client, handler)
+        with pytest.raises(SahmkError) as exc_info:
+            client.quote("2222")
+        assert "Request timed out" in str(exc_info.value)
@@ -0,0 +1,111 @@
+"""Tests for columnar historical data (historical_arrays / historical_df)."""
+
+from unittest import mock
+
+import pytest
+import responses
+
+from sahmk.client import SahmkError
+from sahmk._columnar import ohlcv_columns
+from sahmk.models import OHLCV
+
+np = pytest.importorskip("numpy")
+
+
+class TestOhlcvColumns:
+    """Tests for converting OHLCV bars into NumPy arrays."""
+
+    def test_daily_bars(self, sample_historical_response):
+        bars = [OHLCV.from_dict(d) for d in sample_historical_response["data"]]
+
+        columns = ohlcv_columns(bars)
+
+        assert list(columns) == ["date", "open", "high", "low", "close", "volume"]
+        assert columns["date"].dtype == np.dtype("datetime64[D]")
+        assert columns["date"][0] == np.datetime64("2024-01-01")
+        assert columns["close"].dtype == np.float32
+        assert columns["close"][1] == np.float32(32.6)
+        assert columns["volume"].dtype == np.int64
+        assert columns["volume"].tolist() == [12000000, 13500000]
+
+    def test_intraday_dates_converted_to_utc(self):
+        bars = [
+            OHLCV.from_dict({"date": "2026-01-03T13:00:00+03:00", "close": 32.0, "volume": 1}),
+            OHLCV.from_dict({"date": "2026-01-03T14:00:00+03:00", "close": 32.1, "volume": 2}),
+        ]
+
+        columns = ohlcv_columns(bars)
+
+        assert columns["date"].dtype == np.dtype("datetime64[s]")
+        assert columns["date"][0] == np.datetime64("2026-01-03T10:00:00")
+
+    def test_missing_values(self):
+        bars = [
+            OHLCV.from_dict({"date": "2024-01-01", "close": 1.0, "volume": 10}),
+            OHLCV.from_dict({"date": "2024-01-02"}),
+        ]
+
+        columns = ohlcv_columns(bars)
+
+        assert np.isnan(columns["close"][1])
+        assert columns["volume"].dtype == np.float64
+        assert np.isnan(columns["volume"][1])
+
+    def test_empty(self):
+        columns = ohlcv_columns([])
+        assert all(len(column) == 0 for column in columns.values())
+
+    def test_missing_numpy_raises(self):
+        with mock.patch.dict("sys.modules", {"numpy": None}):
+            with pytest.raises(SahmkError) as exc_info:
+                ohlcv_columns([])
+        assert "numpy package required" in str(exc_info.value)
+
+
+class TestClientColumnarHistorical:
+    """Tests for SahmkClient.historical_arrays and historical_df."""
+
+    @responses.activate
+    def test_historical_arrays(self, mock_client, sample_historical_response):
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/historical/2222/",
+            json=sample_historical_response,
+        )
+
+        arrays = mock_client.historical_arrays("2222", interval="1d")
+
+        assert arrays["close"].tolist() == pytest.approx([32.4, 32.6])
+        assert "interval=1d" in responses.calls[0].request.url
+
+    @responses.activate
+    def test_historical_df(self, mock_client, sample_historical_response):
+        pd = pytest.importorskip("pandas")
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/historical/2222/",
+            json=sample_historical_response,
+        )
+
+        df = mock_client.historical_df("2222")
+
+        assert list(df.columns) == ["date", "open", "high", "low", "close", "volume"]
+        assert len(df) == 2
+        assert df["open"].dtype == np.float32
+        assert df["volume"].dtype == np.int64
+        expected_unit = "ns" if pd.__version__.startswith("1.") else "s"
+        assert df["date"].dtype == np.dtype(f"datetime64[{expected_unit}]")
+        assert df["date"][0] == pd.Timestamp("2024-01-01")
+
+    @responses.activate
+    def test_missing_pandas_raises(self, mock_client, sample_historical_response):
+        responses.add(
+            responses.GET,
+            f"{mock_client.base_url}/historical/2222/",
+            json=sample_historical_response,
+        )
+
+        with mock.patch.dict("sys.modules", {"pandas": None}):
+            with pytest.raises(SahmkError) as exc_info:
+                mock_client.historical_df("2222")
+        assert "pandas package required" in str(exc_info.value)
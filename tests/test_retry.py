@@ -187,6 +187,86 @@ class TestRetryOnRateLimit:
             retry_client._request("GET", "/quote/2222/")
             mock_sleep.assert_called_once_with(0.01)
 
+    @responses.activate
+    def test_retry_after_is_capped(self, retry_client):
+        """Should never sleep longer than 30s on a server hint."""
+        url = f"{retry_client.base_url}/quote/2222/"
+        responses.add(
+            responses.GET, url,
+            json={"error": {"code": "RATE_LIMIT", "message": "Too many"}},
+            status=429,
+            headers={"Retry-After": "3600"},
+        )
+        responses.add(responses.GET, url, json={"symbol": "2222"}, status=200)
+
+        with mock.patch("time.sleep") as mock_sleep:
+            retry_client._request("GET", "/quote/2222/")
+            mock_sleep.assert_called_once_with(30.0)
+
+    @responses.activate
+    def test_falls_back_to_rate_limit_reset_epoch(self, retry_client):
+        """Without Retry-After, wait until the X-RateLimit-Reset epoch."""
+        url = f"{retry_client.base_url}/quote/2222/"
+        responses.add(
+            responses.GET, url,
+            json={"error": {"code": "RATE_LIMIT", "message": "Too many"}},
+            status=429,
+            headers={"X-RateLimit-Reset": "1700000005"},
+        )
+        responses.add(responses.GET, url, json={"symbol": "2222"}, status=200)
+
+        with mock.patch("time.time", return_value=1700000000.0):
+            with mock.patch("time.sleep") as mock_sleep:
+                retry_client._request("GET", "/quote/2222/")
+        mock_sleep.assert_called_once_with(5.0)
+
+    @responses.activate
+    def test_falls_back_to_rate_limit_reset_iso(self, retry_client):
+        """ISO-8601 X-RateLimit-Reset values are converted to a wait."""
+        url = f"{retry_client.base_url}/quote/2222/"
+        responses.add(
+            responses.GET, url,
+            json={"error": {"code": "RATE_LIMIT", "message": "Too many"}},
+            status=429,
+            headers={"X-RateLimit-Reset": "2026-04-03T00:00:02+03:00"},
+        )
+        responses.add(responses.GET, url, json={"symbol": "2222"}, status=200)
+
+        reset_at = 1775163600.0  # 2026-04-03T00:00:00+03:00
+        with mock.patch("time.time", return_value=reset_at):
+            with mock.patch("time.sleep") as mock_sleep:
+                retry_client._request("GET", "/quote/2222/")
+        mock_sleep.assert_called_once_with(2.0)
+
+    @responses.activate
+    def test_past_reset_does_not_sleep_negative(self, retry_client):
+        """A reset time already in the past retries immediately."""
+        url = f"{retry_client.base_url}/quote/2222/"
+        responses.add(
+            responses.GET, url,
+            json={"error": {"code": "RATE_LIMIT", "message": "Too many"}},
+            status=429,
+            headers={"X-RateLimit-Reset": "1600000000"},
+        )
+        responses.add(responses.GET, url, json={"symbol": "2222"}, status=200)
+
+        with mock.patch("time.sleep") as mock_sleep:
+            retry_client._request("GET", "/quote/2222/")
+        mock_sleep.assert_called_once_with(0.0)
+
+    @responses.activate
+    def test_retry_count_tracks_retries(self, retry_client):
+        """retry_count counts every retried attempt."""
+        url = f"{retry_client.base_url}/quote/2222/"
+        responses.add(responses.GET, url, json={}, status=429, headers={"Retry-After": "0"})
+        responses.add(responses.GET, url, json={}, status=503)
+        responses.add(responses.GET, url, json={"symbol": "2222"}, status=200)
+
+        assert retry_client.retry_count == 0
+        with mock.patch("time.sleep"):
+            retry_client._request("GET", "/quote/2222/")
+        assert retry_client.retry_count == 2
+
     @responses.activate
     def test_429_raises_rate_limit_error(self, no_retry_client):
         """429 should raise SahmkRateLimitError (subclass of SahmkError)."""
@@ -214,6 +294,23 @@ class TestRetryOnRateLimit:
         assert err.rate_remaining == 0
         assert err.rate_reset == "2026-04-03T00:00:00+03:00"
 
+    @responses.activate
+    def test_429_http_date_retry_after(self, no_retry_client):
+        """HTTP-date Retry-After is exposed as seconds on the error."""
+        url = f"{no_retry_client.base_url}/quote/2222/"
+        responses.add(
+            responses.GET, url,
+            json={"error": {"code": "RATE_LIMIT", "message": "Too many"}},
+            status=429,
+            headers={"Retry-After": "Tue, 14 Nov 2023 22:13:40 GMT"},
+        )
+
+        with mock.patch("time.time", return_value=1700000000.0):
+            with pytest.raises(SahmkRateLimitError) as exc_info:
+                no_retry_client._request("GET", "/quote/2222/")
+
+        assert exc_info.value.retry_after == pytest.approx(20.0)
+
     @responses.activate
     def test_429_without_headers(self, no_retry_client):
         """429 without rate-limit headers still works."""
@@ -6,7 +6,7 @@ import pytest
 from unittest import mock
 
 from sahmk import SahmkClient
-from sahmk.client import SahmkError, WS_URL, DEPTH_WS_URL, TRADES_WS_URL
+from sahmk.client import SahmkError, WS_URL, DEPTH_WS_URL, TRADES_WS_URL, _json_dumps
 
 
 class MockWebSocket:
@@ -72,6 +72,19 @@ class DisconnectingWebSocket(MockWebSocket):
         raise self.disconnect_error
 
 
+class PipelineRecordingWebSocket(MockWebSocket):
+    """Records how many subscribe messages were sent before each ack was read."""
+
+    def __init__(self, recv_sequence=None, connect_response=None):
+        super().__init__(recv_sequence, connect_response)
+        self.sent_before_ack = []
+
+    async def recv(self):
+        if self.recv_index > 0:
+            self.sent_before_ack.append(len(self.sent_messages))
+        return await super().recv()
+
+
 class TestWebSocketImports:
     """Tests for WebSocket import handling."""
 
@@ -193,6 +206,23 @@ class TestWebSocketStream:
         assert len(subscribe_calls[0]["symbols"]) == 20
         assert len(subscribe_calls[1]["symbols"]) == 5
 
+    @pytest.mark.asyncio
+    async def test_stream_pipelines_subscribe_batches(self, mock_client):
+        """All subscribe batches are sent before the first ack is awaited."""
+        symbols = [str(i) for i in range(45)]
+        mock_ws = PipelineRecordingWebSocket(
+            recv_sequence=[{"type": "subscribed", "symbols": []}] * 3
+        )
+
+        with mock.patch("websockets.connect", return_value=mock_ws):
+            try:
+                await asyncio.wait_for(mock_client.stream(symbols), timeout=0.2)
+            except asyncio.TimeoutError:
+                pass
+
+        assert len(mock_ws.sent_messages) == 3
+        assert mock_ws.sent_before_ack[:3] == [3, 3, 3]
+
 
 class TestWebSocketSuccess:
     """Tests for successful WebSocket operations."""
@@ -444,6 +474,42 @@ class TestWebSocketReconnect:
 
         assert call_count > 3
 
+    @pytest.mark.asyncio
+    async def test_backoff_resets_after_stream_delivers_data(self, mock_client):
+        """A reconnect that streams data resets the attempt count and delay."""
+        sleep_durations = []
+        original_sleep = asyncio.sleep
+
+        async def mock_sleep(duration):
+            sleep_durations.append(duration)
+            await original_sleep(0)
+
+        call_count = 0
+
+        def make_ws(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count > 5:
+                raise asyncio.CancelledError("stopping test")
+            return DisconnectingWebSocket(
+                recv_sequence=[{"type": "subscribed", "symbols": ["2222"]}],
+                disconnect_after=1,
+            )
+
+        with mock.patch("websockets.connect", side_effect=make_ws):
+            with mock.patch("asyncio.sleep", side_effect=mock_sleep):
+                with mock.patch("random.uniform", side_effect=lambda low, high: (low + high) / 2):
+                    with pytest.raises(asyncio.CancelledError):
+                        await mock_client.stream(
+                            ["2222"],
+                            max_reconnect_attempts=2,
+                            initial_reconnect_delay=1.0,
+                            max_reconnect_delay=10.0,
+                        )
+
+        assert call_count == 6
+        assert sleep_durations == [1.0, 1.0, 1.0, 1.0, 1.0]
+
     @pytest.mark.asyncio
     async def test_sahmk_error_not_retried(self, mock_client):
         """SahmkError (auth failures etc.) should not trigger reconnect."""
@@ -518,6 +584,62 @@ class TestWebSocketReconnect:
         for msg in subscribe_msgs:
             assert set(msg["symbols"]) == set(symbols)
 
+    @pytest.mark.asyncio
+    async def test_subscribe_frames_serialized_once_across_reconnects(self, mock_client):
+        """Subscribe payloads are built once per stream and resent verbatim."""
+        sent_frames = []
+
+        class RecordingWebSocket(DisconnectingWebSocket):
+            async def send(self, message):
+                sent_frames.append(message)
+
+        def make_ws(*args, **kwargs):
+            return RecordingWebSocket(
+                recv_sequence=[{"type": "subscribed", "symbols": ["2222"]}],
+                disconnect_after=0,
+            )
+
+        with mock.patch("websockets.connect", side_effect=make_ws):
+            with mock.patch("sahmk.client._json_dumps", wraps=_json_dumps) as dumps:
+                with pytest.raises(SahmkError):
+                    await mock_client.stream(
+                        ["2222"],
+                        max_reconnect_attempts=2,
+                        initial_reconnect_delay=0.01,
+                    )
+
+        assert len(sent_frames) == 3
+        assert sent_frames[0] is sent_frames[1] is sent_frames[2]
+        assert dumps.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnect_ignores_later_mutation_of_symbols(self, mock_client):
+        """Reconnects resubscribe to the symbols given at call time."""
+        symbols = ["2222"]
+        sent_frames = []
+
+        class RecordingWebSocket(DisconnectingWebSocket):
+            async def send(self, message):
+                sent_frames.append(json.loads(message))
+
+        def make_ws(*args, **kwargs):
+            symbols.append("1120")
+            return RecordingWebSocket(
+                recv_sequence=[{"type": "subscribed", "symbols": ["2222"]}],
+                disconnect_after=0,
+            )
+
+        with mock.patch("websockets.connect", side_effect=make_ws):
+            with pytest.raises(SahmkError):
+                await mock_client.stream(
+                    symbols,
+                    max_reconnect_attempts=2,
+                    initial_reconnect_delay=0.01,
+                )
+
+        assert len(sent_frames) == 3
+        assert all(frame["symbols"] == ["2222"] for frame in sent_frames)
+
     @pytest.mark.asyncio
     async def test_stream_reconnects_after_clean_server_close(self, mock_client):
         """A clean server close still triggers reconnect behavior."""
@@ -901,6 +1023,220 @@ class TestStreamConnectionMethod:
         assert quotes[0]["data"]["price"] == 32.50
 
 
+class TestMessageDispatch:
+    """Tests for the bounded-queue split between receiving and callbacks."""
+
+    @pytest.mark.asyncio
+    async def test_slow_callback_does_not_block_receiving(self, mock_client):
+        """Frames keep being read while a slow on_quote callback runs."""
+        received = []
+        handled = []
+        release = asyncio.Event()
+
+        async def on_quote(data):
+            if not handled:
+                await release.wait()
+            handled.append(data["symbol"])
+
+        class BurstWebSocket(MockWebSocket):
+            def __init__(self):
+                super().__init__(
+                    recv_sequence=[{"type": "subscribed", "symbols": ["1", "2", "3"]}]
+                )
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if len(received) == 3:
+                    release.set()
+                    raise StopAsyncIteration
+                symbol = str(len(received) + 1)
+                received.append(symbol)
+                return json.dumps({"type": "quote", "symbol": symbol})
+
+        with mock.patch("websockets.connect", return_value=BurstWebSocket()):
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(
+                    mock_client._stream_connection(
+                        symbols=["1", "2", "3"],
+                        on_quote=on_quote,
+                    ),
+                    timeout=1,
+                )
+
+        assert received == ["1", "2", "3"]
+        assert handled == ["1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_receive_error_is_reraised(self, mock_client):
+        """Errors raised by the receive loop surface from the connection."""
+        mock_ws = DisconnectingWebSocket(
+            recv_sequence=[{"type": "subscribed", "symbols": ["2222"]}],
+            disconnect_after=0,
+            disconnect_error=ConnectionResetError("reset by peer"),
+        )
+
+        with mock.patch("websockets.connect", return_value=mock_ws):
+            with pytest.raises(ConnectionResetError, match="reset by peer"):
+                await mock_client._stream_connection(symbols=["2222"])
+
+    @pytest.mark.asyncio
+    async def test_callback_error_propagates(self, mock_client):
+        """Exceptions raised by a callback still end the connection."""
+
+        async def on_quote(data):
+            raise ValueError("handler failed")
+
+        mock_ws = DisconnectingWebSocket(
+            recv_sequence=[
+                {"type": "subscribed", "symbols": ["2222"]},
+                {"type": "quote", "symbol": "2222"},
+            ],
+            disconnect_after=2,
+        )
+
+        with mock.patch("websockets.connect", return_value=mock_ws):
+            with pytest.raises(ValueError, match="handler failed"):
+                await mock_client._stream_connection(
+                    symbols=["2222"],
+                    on_quote=on_quote,
+                )
+
+    @pytest.mark.asyncio
+    async def test_keepalive_uses_protocol_pings(self, mock_client):
+        """Keep-alive is delegated to websockets; no JSON ping frames are sent."""
+        mock_ws = MockWebSocket(
+            recv_sequence=[{"type": "subscribed", "symbols": ["2222"]}]
+        )
+        connect_mock = mock.MagicMock(return_value=mock_ws)
+
+        with mock.patch("websockets.connect", connect_mock):
+            try:
+                await asyncio.wait_for(
+                    mock_client.stream(["2222"], ping_interval=0.02),
+                    timeout=0.1,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        kwargs = connect_mock.call_args[1]
+        assert kwargs["ping_interval"] == 0.02
+        assert kwargs["ping_timeout"] == 0.04
+        assert [m for m in mock_ws.sent_messages if m.get("action") == "ping"] == []
+
+    @pytest.mark.asyncio
+    async def test_keepalive_disabled(self, mock_client):
+        """ping_interval=None disables protocol keep-alive pings."""
+        mock_ws = MockWebSocket(
+            recv_sequence=[{"type": "subscribed", "symbols": ["2222"]}]
+        )
+        connect_mock = mock.MagicMock(return_value=mock_ws)
+
+        with mock.patch("websockets.connect", connect_mock):
+            try:
+                await asyncio.wait_for(
+                    mock_client.stream_depth(["2222"], ping_interval=None),
+                    timeout=0.1,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        kwargs = connect_mock.call_args[1]
+        assert kwargs["ping_interval"] is None
+        assert kwargs["ping_timeout"] is None
+
+class TestWireFormat:
+    """Tests for negotiated msgpack framing on the quote stream."""
+
+    @pytest.mark.asyncio
+    async def test_msgpack_requested_and_decoded(self, mock_client):
+        msgpack = pytest.importorskip("msgpack")
+        quotes = []
+
+        async def on_quote(data):
+            quotes.append(data)
+
+        class MsgpackWebSocket(MockWebSocket):
+            def __init__(self):
+                super().__init__()
+                self.frames = [
+                    msgpack.packb({"type": "connected"}),
+                    msgpack.packb({"type": "subscribed", "symbols": ["2222"]}),
+                ]
+                self.delivered = False
+
+            async def recv(self):
+                return self.frames.pop(0)
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if self.delivered:
+                    raise StopAsyncIteration
+                self.delivered = True
+                return msgpack.packb(
+                    {"type": "quote", "symbol": "2222", "data": {"price": 32.5}}
+                )
+
+        connect_mock = mock.MagicMock(return_value=MsgpackWebSocket())
+
+        with mock.patch("websockets.connect", connect_mock):
+            with pytest.raises(SahmkError):
+                await mock_client.stream(
+                    ["2222"],
+                    on_quote=on_quote,
+                    wire_format="msgpack",
+                    max_reconnect_attempts=-1,
+                )
+
+        assert "format=msgpack" in connect_mock.call_args[0][0]
+        assert quotes == [{"type": "quote", "symbol": "2222", "data": {"price": 32.5}}]
+
+    @pytest.mark.asyncio
+    async def test_msgpack_falls_back_to_json_text_frames(self, mock_client):
+        pytest.importorskip("msgpack")
+        mock_ws = MockWebSocket(
+            recv_sequence=[{"type": "subscribed", "symbols": ["2222"]}]
+        )
+
+        with mock.patch("websockets.connect", return_value=mock_ws):
+            try:
+                await asyncio.wait_for(
+                    mock_client.stream(["2222"], wire_format="msgpack"),
+                    timeout=0.1,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        assert mock_ws.sent_messages == [{"action": "subscribe", "symbols": ["2222"]}]
+
+    @pytest.mark.asyncio
+    async def test_json_is_default(self, mock_client):
+        connect_mock = mock.MagicMock(return_value=MockWebSocket())
+
+        with mock.patch("websockets.connect", connect_mock):
+            try:
+                await asyncio.wait_for(mock_client.stream(["2222"]), timeout=0.1)
+            except asyncio.TimeoutError:
+                pass
+
+        assert "format=" not in connect_mock.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_invalid_wire_format(self, mock_client):
+        with pytest.raises(ValueError):
+            await mock_client.stream(["2222"], wire_format="protobuf")
+
+    @pytest.mark.asyncio
+    async def test_missing_msgpack_raises(self, mock_client):
+        with mock.patch.dict("sys.modules", {"msgpack": None}):
+            with pytest.raises(SahmkError) as exc_info:
+                await mock_client.stream(["2222"], wire_format="msgpack")
+        assert "msgpack package required" in str(exc_info.value)
+
+
 class TestDepthWebSocketStream:
     """Tests for the stream_depth method."""
 
@@ -963,6 +1299,25 @@ class TestDepthWebSocketStream:
         assert subscribe_calls[0]["symbols"] == ["2222"]
         assert subscribe_calls[0]["levels"] == 5
 
+    @pytest.mark.asyncio
+    async def test_stream_depth_pipelines_subscribe_batches(self, mock_client):
+        """Depth subscribe batches are sent before acks are collected."""
+        symbols = [str(i) for i in range(25)]
+        mock_ws = PipelineRecordingWebSocket(
+            recv_sequence=[{"type": "subscribed", "symbols": []}] * 2
+        )
+
+        with mock.patch("websockets.connect", return_value=mock_ws):
+            try:
+                await asyncio.wait_for(
+                    mock_client.stream_depth(symbols, levels=5), timeout=0.2
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        assert [len(m["symbols"]) for m in mock_ws.sent_messages] == [20, 5]
+        assert mock_ws.sent_before_ack[:2] == [2, 2]
+
     @pytest.mark.asyncio
     async def test_stream_depth_forwards_snapshot_before_ack(self, mock_client):
         """Depth snapshots emitted before subscribed ack should reach on_depth."""